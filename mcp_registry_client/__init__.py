@@ -1,7 +1,11 @@
 """MCP Registry Client - A Python client for the MCP server registry."""
 
-from .client import RegistryClient, RegistryClientError, RegistryAPIError
-from .models import Server, SearchResponse, Repository, Package
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import RegistryAPIError, RegistryClient, RegistryClientError
+    from .models import Package, Repository, SearchResponse, Server
 
 __version__ = '0.1.0'
 
@@ -14,3 +18,27 @@ __all__ = [
     'Repository',
     'Package',
 ]
+
+# Public names are imported on first access, so that importing the CLI does not
+# pull in httpx and pydantic before a command actually needs them.
+_LAZY_IMPORTS = {
+    'RegistryClient': '.client',
+    'RegistryClientError': '.client',
+    'RegistryAPIError': '.client',
+    'Server': '.models',
+    'SearchResponse': '.models',
+    'Repository': '.models',
+    'Package': '.models',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name lazily on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,16 +2,21 @@
 
 import asyncio
 import time
+from collections import OrderedDict
 from typing import Any, TypeVar
 
 from .config import ClientConfig
 
 T = TypeVar('T')
 
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
 
 class CacheEntry:
     """Cache entry with expiration support."""
 
+    __slots__ = ('expires_at_ns', 'expiry_handle', 'value')
+
     def __init__(self, value: T, ttl: int) -> None:
         """Initialize cache entry.
 
@@ -21,15 +26,29 @@ class CacheEntry:
 
         """
         self.value = value
-        self.expires_at = time.time() + ttl
+        # Monotonic clock: TTLs must not jump with wall-clock adjustments
+        self.expires_at_ns = time.monotonic_ns() + ttl * NANOSECONDS_PER_SECOND
+        self.expiry_handle: asyncio.TimerHandle | None = None
 
     def is_expired(self) -> bool:
         """Check if the cache entry has expired."""
-        return time.time() > self.expires_at
+        return time.monotonic_ns() > self.expires_at_ns
+
+    def cancel_expiry(self) -> None:
+        """Cancel the scheduled expiry callback, if any."""
+        if self.expiry_handle is not None:
+            self.expiry_handle.cancel()
+            self.expiry_handle = None
 
 
 class ResponseCache:
-    """In-memory response cache with TTL support."""
+    """In-memory LRU response cache with TTL support.
+
+    Holds at most `cache_max_size` entries; once full, setting a new key evicts
+    the least recently used entry. When set from within a running event loop, each
+    entry schedules its own removal at expiry time; otherwise expired entries are
+    dropped when read.
+    """
 
     def __init__(self, config: ClientConfig) -> None:
         """Initialize response cache.
@@ -40,12 +59,15 @@ class ResponseCache:
         """
         self.enabled = config.enable_cache
         self.ttl = config.cache_ttl
-        self._cache: dict[str, CacheEntry] = {}
-        self._lock = asyncio.Lock()
+        self.max_size = config.cache_max_size
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
 
-    async def get(self, key: str) -> Any | None:  # noqa: ANN401
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
         """Get a value from the cache.
 
+        No cache operation yields to the event loop partway through, so none of
+        them need a lock.
+
         Args:
             key: Cache key
 
@@ -56,18 +78,20 @@ class ResponseCache:
         if not self.enabled:
             return None
 
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
-            if entry.is_expired():
-                del self._cache[key]
-                return None
+        # Compare against the deadline inline rather than through is_expired(),
+        # saving a method call on every hit
+        if time.monotonic_ns() > entry.expires_at_ns:
+            self._discard(key)
+            return None
 
-            return entry.value
+        self._cache.move_to_end(key)
+        return entry.value
 
-    async def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
         """Set a value in the cache.
 
         Args:
@@ -78,26 +102,49 @@ class ResponseCache:
         if not self.enabled:
             return
 
-        async with self._lock:
-            self._cache[key] = CacheEntry(value, self.ttl)
-
-    async def clear(self) -> None:
+        self._discard(key)
+        entry = CacheEntry(value, self.ttl)
+        self._cache[key] = entry
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # No event loop: rely on expiry checks at read time
+        else:
+            entry.expiry_handle = loop.call_later(self.ttl, self._expire, key, entry)
+
+        while len(self._cache) > self.max_size:
+            _, evicted = self._cache.popitem(last=False)
+            evicted.cancel_expiry()
+
+    def _discard(self, key: str) -> None:
+        """Remove an entry and cancel its scheduled expiry."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            entry.cancel_expiry()
+
+    def _expire(self, key: str, entry: CacheEntry) -> None:
+        """Remove an entry when its TTL elapses, unless it has been replaced."""
+        if self._cache.get(key) is entry:
+            del self._cache[key]
+
+    def clear(self) -> None:
         """Clear all cached values."""
-        async with self._lock:
-            self._cache.clear()
+        for entry in self._cache.values():
+            entry.cancel_expiry()
+        self._cache.clear()
 
-    async def cleanup_expired(self) -> None:
+    def cleanup_expired(self) -> None:
         """Remove expired entries from the cache."""
         if not self.enabled:
             return
 
-        async with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, entry in self._cache.items() if current_time > entry.expires_at
-            ]
-            for key in expired_keys:
-                del self._cache[key]
+        now_ns = time.monotonic_ns()
+        expired_keys = [
+            key for key, entry in self._cache.items() if now_ns > entry.expires_at_ns
+        ]
+        for key in expired_keys:
+            self._discard(key)
 
     def cache_key_for_search(self, name: str) -> str:
         """Generate cache key for search requests.
@@ -109,7 +156,7 @@ class ResponseCache:
             Cache key
 
         """
-        return f'search:{name.lower().strip()}'
+        return f'search:{name.strip().lower()}'
 
     def cache_key_for_server(self, server_id: str) -> str:
         """Generate cache key for server requests.
@@ -133,4 +180,4 @@ class ResponseCache:
             Cache key
 
         """
-        return f'server_by_name:{name.lower().strip()}'
+        return f'server_by_name:{name.strip().lower()}'
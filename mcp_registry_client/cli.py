@@ -2,9 +2,14 @@
 
 import argparse
 import asyncio
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
-from .commands import BaseCommand, InfoCommand, SearchCommand
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .commands.base import BaseCommand
 
 logger = logging.getLogger(__name__)
 
@@ -27,13 +32,36 @@ def setup_logging(verbose: bool = False) -> None:  # noqa: FBT001, FBT002
         logging.getLogger('httpx').setLevel(logging.WARNING)
 
 
-# Command registry mapping command names to command classes
-COMMAND_REGISTRY: dict[str, type[BaseCommand]] = {
-    'search': SearchCommand,
-    'info': InfoCommand,
+# Command registry mapping command names to the module and class implementing
+# them. Command modules (and with them httpx and pydantic) are only imported once
+# the requested command is known, so `--help` and usage errors stay cheap.
+COMMAND_REGISTRY: dict[str, tuple[str, str]] = {
+    'search': ('mcp_registry_client.commands.search', 'SearchCommand'),
+    'info': ('mcp_registry_client.commands.info', 'InfoCommand'),
 }
 
 
+def load_command(name: str) -> 'type[BaseCommand] | None':
+    """Import and return the command class registered under a name.
+
+    Args:
+        name: Command name as given on the command line
+
+    Returns:
+        Command class, or None if no command is registered under the name
+
+    """
+    entry = COMMAND_REGISTRY.get(name)
+    if entry is None:
+        return None
+
+    module_name, class_name = entry
+    command_class: type[BaseCommand] = getattr(
+        importlib.import_module(module_name), class_name
+    )
+    return command_class
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
@@ -88,22 +116,44 @@ async def async_main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
-    setup_logging(verbose=args.verbose)
-
-    # Get command class from registry
-    command_class = COMMAND_REGISTRY.get(args.command)
+    # Get command class from registry before touching logging configuration
+    command_class = load_command(args.command)
     if command_class is None:
         parser.print_help()
         return 1
 
+    setup_logging(verbose=args.verbose)
+
+    # The command module has imported the client by now
+    from .client import close_shared_client  # noqa: PLC0415
+
     # Create and run command
     command = command_class(args)
-    return await command.run()
+    try:
+        return await command.run()
+    finally:
+        await close_shared_client()
+
+
+def event_loop_factory() -> 'Callable[[], asyncio.AbstractEventLoop] | None':
+    """Get the uvloop event loop factory if the optional uvloop is installed.
+
+    Returns:
+        uvloop's loop factory, or None to use the default asyncio event loop
+
+    """
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
 
 
 def main() -> int:
     """Run main entry point."""
     try:
-        return asyncio.run(async_main())
+        return asyncio.run(async_main(), loop_factory=event_loop_factory())
     except KeyboardInterrupt:
         return 130
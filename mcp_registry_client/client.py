@@ -1,6 +1,11 @@
 """Async HTTP client for the MCP registry API."""
 
+import asyncio
 import logging
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Mapping
+from functools import partial
 from typing import Any
 
 import httpx
@@ -8,6 +13,7 @@ from pydantic import ValidationError
 
 from .cache import ResponseCache
 from .config import ClientConfig, get_client_config
+from .constants import ERROR_BODY_MAX_BYTES
 from .models import RegistryError, SearchResponse, Server
 from .retry import RetryStrategy, with_retry
 
@@ -40,6 +46,8 @@ class RegistryClient:
         base_url: str | None = None,
         timeout: float | None = None,
         config: ClientConfig | None = None,
+        *,
+        event_hooks: Mapping[str, list[Callable[..., Any]]] | None = None,
     ) -> None:
         """Initialize the registry client.
 
@@ -47,6 +55,8 @@ class RegistryClient:
             base_url: Base URL for the registry API (overrides config)
             timeout: Request timeout in seconds (overrides config)
             config: Client configuration (if None, loads from environment)
+            event_hooks: httpx event hooks to run for every request or response,
+                keyed by 'request' or 'response'
 
         """
         if config is None:
@@ -64,6 +74,8 @@ class RegistryClient:
         self._client: httpx.AsyncClient | None = None
         self._retry_strategy = RetryStrategy(config)
         self._cache = ResponseCache(config)
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._event_hooks = event_hooks
 
         # Create timeout configuration
         self._timeout_config = httpx.Timeout(
@@ -73,6 +85,18 @@ class RegistryClient:
             pool=config.pool_timeout,
         )
 
+        self._default_headers = {
+            'User-Agent': config.user_agent,
+            'Accept': 'application/json',
+        }
+
+        # Keep idle connections around long enough to be reused across requests
+        self._limits = httpx.Limits(
+            max_connections=config.pool_max_connections,
+            max_keepalive_connections=config.pool_max_keepalive,
+            keepalive_expiry=config.pool_keepalive_expiry,
+        )
+
     async def __aenter__(self) -> 'RegistryClient':
         """Async context manager entry."""
         await self._ensure_client()
@@ -93,10 +117,9 @@ class RegistryClient:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=self._timeout_config,
-                headers={
-                    'User-Agent': self.config.user_agent,
-                    'Accept': 'application/json',
-                },
+                limits=self._limits,
+                headers=self._default_headers,
+                event_hooks=self._event_hooks,
             )
 
     async def close(self) -> None:
@@ -127,17 +150,14 @@ class RegistryClient:
         """
         await self._ensure_client()
 
-        if self._client is None:
+        client = self._client
+        if client is None:
             msg = 'HTTP client not initialized'
             raise RegistryClientError(msg)
 
         async def _do_request() -> httpx.Response:
-            if self._client is None:
-                msg = 'HTTP client not initialized'
-                raise RegistryClientError(msg)
-
             # Let retry logic handle exceptions
-            response = await self._client.request(method, path, **kwargs)
+            response = await client.request(method, path, **kwargs)
             response.raise_for_status()
             return response
 
@@ -151,22 +171,90 @@ class RegistryClient:
             raise RegistryAPIError(msg) from e
         except httpx.HTTPStatusError as e:
             logger.debug('HTTP error after retries: %s', e)
-            # Try to parse error response
-            try:
-                error_data = e.response.json()
-                error = RegistryError.model_validate(error_data)
+            status_code = e.response.status_code
+            error = self._parse_error_response(e.response)
+            if error is not None:
                 raise RegistryAPIError(
                     error.message or error.error,
-                    status_code=e.response.status_code,
-                ) from e
-            except (ValueError, ValidationError):
-                # Fallback to generic error message
-                msg = f'HTTP {e.response.status_code}: {e.response.text}'
-                raise RegistryAPIError(
-                    msg,
-                    status_code=e.response.status_code,
+                    status_code=status_code,
                 ) from e
 
+            # Fallback to generic error message with a bounded excerpt of the body
+            body = e.response.content[:ERROR_BODY_MAX_BYTES].decode(
+                'utf-8', errors='replace'
+            )
+            msg = f'HTTP {status_code}: {body}'
+            raise RegistryAPIError(msg, status_code=status_code) from e
+
+    @staticmethod
+    def _parse_error_response(response: httpx.Response) -> RegistryError | None:
+        """Parse a registry error body, if the response declares one as JSON.
+
+        Args:
+            response: HTTP error response
+
+        Returns:
+            Parsed registry error, or None if the body is not a JSON error object
+
+        """
+        if 'json' not in response.headers.get('content-type', ''):
+            return None
+
+        try:
+            error = RegistryError.model_validate_json(response.content)
+        except ValidationError:
+            return None
+
+        return error
+
+    async def _coalesce[T](self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run a fetch once for all concurrent callers sharing the same key.
+
+        The first caller performs the fetch; callers arriving while it is in
+        flight wait for the same result (or exception) instead of issuing a
+        duplicate request. If the first caller is cancelled, the callers still
+        waiting start the fetch again rather than being cancelled with it.
+
+        Args:
+            key: Cache key identifying the request
+            fetch: Async function performing the request
+
+        Returns:
+            Result of the shared fetch
+
+        """
+        inflight = self._inflight.get(key)
+        while inflight is not None:
+            logger.debug('Joining in-flight request for: %s', key)
+            try:
+                # Shield so a cancelled waiter does not cancel the shared result
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Give up only if this caller was cancelled; if the caller that
+                # was fetching was cancelled instead, join or start a new fetch
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+            inflight = self._inflight.get(key)
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case no other caller joined
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
     async def search_servers(self, name: str) -> SearchResponse:
         """Search for MCP servers in the registry.
 
@@ -187,19 +275,24 @@ class RegistryClient:
 
         # Check cache first
         cache_key = self._cache.cache_key_for_search(name)
-        cached_result = await self._cache.get(cache_key)
+        cached_result = self._cache.get(cache_key)
         if cached_result is not None:
             logger.debug('Returning cached search result for: %s', name)
             return cached_result  # type: ignore[no-any-return]
 
+        return await self._coalesce(cache_key, partial(self._fetch_search, name, cache_key))
+
+    async def _fetch_search(self, name: str, cache_key: str) -> SearchResponse:
+        """Fetch, filter and cache search results from the registry."""
         params = {'search': name.strip()}
         logger.debug('Searching servers with params: %s', params)
 
         response = await self._make_request('GET', '/v0/servers', params=params)
 
         try:
-            data = response.json()
-            search_response = SearchResponse.model_validate(data)
+            # Validate straight from the raw bytes: pydantic's JSON parser skips
+            # building an intermediate dict
+            search_response = SearchResponse.model_validate_json(response.content)
 
             # Filter servers to only include those with active status
             active_servers = [
@@ -210,7 +303,7 @@ class RegistryClient:
             result = SearchResponse(servers=active_servers)
 
             # Cache the result
-            await self._cache.set(cache_key, result)
+            self._cache.set(cache_key, result)
         except (ValueError, ValidationError) as e:
             logger.exception('Failed to parse search response: %s')
             msg = f'Failed to parse response: {e}'
@@ -234,18 +327,23 @@ class RegistryClient:
         """
         # Check cache first
         cache_key = self._cache.cache_key_for_server(server_id)
-        cached_result = await self._cache.get(cache_key)
+        cached_result = self._cache.get(cache_key)
         if cached_result is not None:
             logger.debug('Returning cached server result for: %s', server_id)
             return cached_result  # type: ignore[no-any-return]
 
+        return await self._coalesce(
+            cache_key, partial(self._fetch_server, server_id, cache_key)
+        )
+
+    async def _fetch_server(self, server_id: str, cache_key: str) -> Server | None:
+        """Fetch, filter and cache a single server from the registry."""
         logger.debug('Getting server with ID: %s', server_id)
 
         response = await self._make_request('GET', f'/v0/servers/{server_id}')
-        data = response.json()
         retval = None
         try:
-            server = Server.model_validate(data)
+            server = Server.model_validate_json(response.content)
 
             # Only return server if it has active status
             if server.status == 'active':
@@ -256,7 +354,7 @@ class RegistryClient:
                 )
 
             # Cache the result (even if None for inactive servers)
-            await self._cache.set(cache_key, retval)
+            self._cache.set(cache_key, retval)
 
         except (ValueError, ValidationError) as e:
             logger.exception('Failed to parse server response: %s')
@@ -268,8 +366,8 @@ class RegistryClient:
     async def get_server_by_name(self, name: str) -> Server | None:
         """Get a server by its name.
 
-        This method searches for servers, finds a match, and then fetches
-        the full server details using the server ID. Only active servers are returned.
+        This method searches for servers, finds a match, and then fetches the full
+        server details using the server ID. Only active servers are returned.
 
         Args:
             name: The server name to search for
@@ -283,7 +381,7 @@ class RegistryClient:
         """
         # Check cache first
         cache_key = self._cache.cache_key_for_server_by_name(name)
-        cached_result = await self._cache.get(cache_key)
+        cached_result = self._cache.get(cache_key)
         if cached_result is not None:
             logger.debug('Returning cached server by name result for: %s', name)
             return cached_result  # type: ignore[no-any-return]
@@ -293,27 +391,54 @@ class RegistryClient:
         # Search for servers with the given name (already filtered to active)
         search_result = await self.search_servers(name=name)
 
-        # Find exact match first
-        server_id = None
-        for server in search_result.servers:
-            if server.name == name:
-                server_id = server.meta.official.id_
-                break
-
-        # If no exact match, try to find partial match
-        if server_id is None:
-            for server in search_result.servers:
-                if name.lower() in server.name.lower():
-                    server_id = server.meta.official.id_
-                    break
+        match = search_result.find_server(name)
 
         # If we found a server, get its full details by ID
         retval = None
-        if server_id:
+        if match is not None and match.meta.official.id_:
             # get_server_by_id already filters for active status
-            retval = await self.get_server_by_id(server_id)
+            retval = await self.get_server_by_id(match.meta.official.id_)
 
         # Cache the result (even if None)
-        await self._cache.set(cache_key, retval)
+        self._cache.set(cache_key, retval)
 
         return retval
+
+
+# Registry clients shared by callers on the same event loop, so that consecutive
+# requests within one run reuse a single connection pool.
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RegistryClient] = (
+    weakref.WeakKeyDictionary()
+)
+_shared_clients_lock = threading.Lock()
+
+
+async def get_client() -> RegistryClient:
+    """Get the shared registry client for the running event loop.
+
+    The client is created on first use and kept until `close_shared_client` is
+    called from the same loop.
+
+    Returns:
+        Registry client with an initialized HTTP client
+
+    """
+    loop = asyncio.get_running_loop()
+    with _shared_clients_lock:
+        client = _shared_clients.get(loop)
+        if client is None:
+            client = RegistryClient()
+            _shared_clients[loop] = client
+
+    await client._ensure_client()  # noqa: SLF001
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the shared registry client for the running event loop, if any."""
+    loop = asyncio.get_running_loop()
+    with _shared_clients_lock:
+        client = _shared_clients.pop(loop, None)
+
+    if client is not None:
+        await client.close()
@@ -1,7 +1,31 @@
 """Command pattern implementation for CLI commands."""
 
-from .base import BaseCommand
-from .info import InfoCommand
-from .search import SearchCommand
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseCommand
+    from .info import InfoCommand
+    from .search import SearchCommand
 
 __all__ = ['BaseCommand', 'InfoCommand', 'SearchCommand']
+
+# Commands are imported on first access, so that loading one command does not
+# load the others.
+_LAZY_IMPORTS = {
+    'BaseCommand': '.base',
+    'InfoCommand': '.info',
+    'SearchCommand': '.search',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a command class lazily on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
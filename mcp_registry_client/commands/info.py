@@ -2,7 +2,7 @@
 
 import argparse
 
-from mcp_registry_client.client import RegistryClient
+from mcp_registry_client.client import get_client
 from mcp_registry_client.config import get_cli_config
 from mcp_registry_client.formatters import (
     format_server_detailed,
@@ -34,7 +34,7 @@ class InfoCommand(BaseCommand):
             ValueError: If server name is invalid
 
         """
-        validate_server_name(self.args.server_name)
+        self.args.server_name = validate_server_name(self.args.server_name)
 
     async def execute(self) -> Server:
         """Execute the info command.
@@ -50,14 +50,14 @@ class InfoCommand(BaseCommand):
             ValueError: If server is not found
 
         """
-        async with RegistryClient() as client:
-            server = await client.get_server_by_name(self.args.server_name)
+        client = await get_client()
+        server = await client.get_server_by_name(self.args.server_name)
 
-            if server is None:
-                msg = f'Server "{self.args.server_name}" not found'
-                raise ValueError(msg)
+        if server is None:
+            msg = f'Server "{self.args.server_name}" not found'
+            raise ValueError(msg)
 
-            return server
+        return server
 
     def format_output(self, result: Server) -> None:
         """Format and display server information.
@@ -2,7 +2,7 @@
 
 import argparse
 
-from mcp_registry_client.client import RegistryClient
+from mcp_registry_client.client import get_client
 from mcp_registry_client.config import get_cli_config
 from mcp_registry_client.formatters import format_server_summary, print_json, print_table
 from mcp_registry_client.models import SearchResponse
@@ -30,7 +30,7 @@ class SearchCommand(BaseCommand):
             ValueError: If search term is invalid
 
         """
-        validate_search_term(self.args.name)
+        self.args.name = validate_search_term(self.args.name)
 
     async def execute(self) -> SearchResponse:
         """Execute the search command.
@@ -45,8 +45,8 @@ class SearchCommand(BaseCommand):
             ValidationError: If response validation fails
 
         """
-        async with RegistryClient() as client:
-            return await client.search_servers(name=self.args.name)
+        client = await get_client()
+        return await client.search_servers(name=self.args.name)
 
     def format_output(self, result: SearchResponse) -> None:
         """Format and display search results.
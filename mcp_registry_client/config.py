@@ -1,43 +1,56 @@
 """Configuration management for the MCP registry client."""
 
 import os
-from dataclasses import dataclass
-
-from .constants import (
-    DEFAULT_BACKOFF_FACTOR,
-    DEFAULT_BASE_URL,
-    DEFAULT_CACHE_TTL,
-    DEFAULT_CONNECT_TIMEOUT,
-    DEFAULT_MAX_RETRIES,
-    DEFAULT_POOL_TIMEOUT,
-    DEFAULT_READ_TIMEOUT,
-    DEFAULT_RETRY_DELAY,
-    DEFAULT_TIMEOUT,
-    DEFAULT_USER_AGENT,
-    DEFAULT_WRITE_TIMEOUT,
-)
-
-
-@dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields, replace
+from functools import partial
+from typing import Any
+
+from . import constants
+
+
+def _default(name: str) -> Any:  # noqa: ANN401
+    """Declare a field whose default is read from constants when a config is created.
+
+    Reading the default lazily keeps importing this module from loading the
+    config.toml file the defaults may come from.
+
+    Args:
+        name: Name of the default in the constants module
+
+    Returns:
+        Dataclass field with a default factory
+
+    """
+    return field(default_factory=partial(getattr, constants, name))
+
+
+@dataclass(slots=True)
 class ClientConfig:
     """Configuration for the registry client."""
 
     # Connection settings
-    base_url: str = DEFAULT_BASE_URL
-    timeout: float = DEFAULT_TIMEOUT  # Overall timeout (backward compatibility)
-    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
-    read_timeout: float = DEFAULT_READ_TIMEOUT
-    write_timeout: float = DEFAULT_WRITE_TIMEOUT
-    pool_timeout: float = DEFAULT_POOL_TIMEOUT
-    user_agent: str = DEFAULT_USER_AGENT
+    base_url: str = _default('DEFAULT_BASE_URL')
+    timeout: float = _default('DEFAULT_TIMEOUT')  # Overall timeout (backward compatibility)
+    connect_timeout: float = _default('DEFAULT_CONNECT_TIMEOUT')
+    read_timeout: float = _default('DEFAULT_READ_TIMEOUT')
+    write_timeout: float = _default('DEFAULT_WRITE_TIMEOUT')
+    pool_timeout: float = _default('DEFAULT_POOL_TIMEOUT')
+    user_agent: str = _default('DEFAULT_USER_AGENT')
+
+    # Connection pool settings
+    pool_max_connections: int = _default('DEFAULT_POOL_MAX_CONNECTIONS')
+    pool_max_keepalive: int = _default('DEFAULT_POOL_MAX_KEEPALIVE')
+    pool_keepalive_expiry: float = _default('DEFAULT_POOL_KEEPALIVE_EXPIRY')
 
     # Retry settings
-    max_retries: int = DEFAULT_MAX_RETRIES
-    retry_delay: float = DEFAULT_RETRY_DELAY
-    backoff_factor: float = DEFAULT_BACKOFF_FACTOR
+    max_retries: int = _default('DEFAULT_MAX_RETRIES')
+    retry_delay: float = _default('DEFAULT_RETRY_DELAY')
+    backoff_factor: float = _default('DEFAULT_BACKOFF_FACTOR')
 
     # Cache settings
-    cache_ttl: int = DEFAULT_CACHE_TTL
+    cache_ttl: int = _default('DEFAULT_CACHE_TTL')
+    cache_max_size: int = _default('DEFAULT_CACHE_MAX_SIZE')
     enable_cache: bool = True
 
     @classmethod
@@ -52,10 +65,14 @@ class ClientConfig:
             MCP_REGISTRY_WRITE_TIMEOUT: Write timeout in seconds
             MCP_REGISTRY_POOL_TIMEOUT: Connection pool timeout in seconds
             MCP_REGISTRY_USER_AGENT: User agent string
+            MCP_REGISTRY_POOL_MAX_CONNECTIONS: Maximum concurrent connections
+            MCP_REGISTRY_POOL_MAX_KEEPALIVE: Maximum idle keep-alive connections
+            MCP_REGISTRY_POOL_KEEPALIVE_EXPIRY: Idle keep-alive expiry in seconds
             MCP_REGISTRY_MAX_RETRIES: Maximum number of retries
             MCP_REGISTRY_RETRY_DELAY: Initial retry delay in seconds
             MCP_REGISTRY_BACKOFF_FACTOR: Exponential backoff factor
             MCP_REGISTRY_CACHE_TTL: Cache TTL in seconds
+            MCP_REGISTRY_CACHE_MAX_SIZE: Maximum number of cached responses
             MCP_REGISTRY_ENABLE_CACHE: Enable/disable caching (true/false)
 
         Returns:
@@ -63,36 +80,69 @@ class ClientConfig:
 
         """
         return cls(
-            base_url=os.getenv('MCP_REGISTRY_BASE_URL', DEFAULT_BASE_URL),
-            timeout=float(os.getenv('MCP_REGISTRY_TIMEOUT', str(DEFAULT_TIMEOUT))),
+            base_url=os.getenv('MCP_REGISTRY_BASE_URL', constants.DEFAULT_BASE_URL),
+            timeout=float(
+                os.getenv('MCP_REGISTRY_TIMEOUT', str(constants.DEFAULT_TIMEOUT))
+            ),
             connect_timeout=float(
-                os.getenv('MCP_REGISTRY_CONNECT_TIMEOUT', str(DEFAULT_CONNECT_TIMEOUT))
+                os.getenv(
+                    'MCP_REGISTRY_CONNECT_TIMEOUT', str(constants.DEFAULT_CONNECT_TIMEOUT)
+                )
             ),
             read_timeout=float(
-                os.getenv('MCP_REGISTRY_READ_TIMEOUT', str(DEFAULT_READ_TIMEOUT))
+                os.getenv('MCP_REGISTRY_READ_TIMEOUT', str(constants.DEFAULT_READ_TIMEOUT))
             ),
             write_timeout=float(
-                os.getenv('MCP_REGISTRY_WRITE_TIMEOUT', str(DEFAULT_WRITE_TIMEOUT))
+                os.getenv(
+                    'MCP_REGISTRY_WRITE_TIMEOUT', str(constants.DEFAULT_WRITE_TIMEOUT)
+                )
             ),
             pool_timeout=float(
-                os.getenv('MCP_REGISTRY_POOL_TIMEOUT', str(DEFAULT_POOL_TIMEOUT))
+                os.getenv('MCP_REGISTRY_POOL_TIMEOUT', str(constants.DEFAULT_POOL_TIMEOUT))
+            ),
+            user_agent=os.getenv('MCP_REGISTRY_USER_AGENT', constants.DEFAULT_USER_AGENT),
+            pool_max_connections=int(
+                os.getenv(
+                    'MCP_REGISTRY_POOL_MAX_CONNECTIONS',
+                    str(constants.DEFAULT_POOL_MAX_CONNECTIONS),
+                )
+            ),
+            pool_max_keepalive=int(
+                os.getenv(
+                    'MCP_REGISTRY_POOL_MAX_KEEPALIVE',
+                    str(constants.DEFAULT_POOL_MAX_KEEPALIVE),
+                )
+            ),
+            pool_keepalive_expiry=float(
+                os.getenv(
+                    'MCP_REGISTRY_POOL_KEEPALIVE_EXPIRY',
+                    str(constants.DEFAULT_POOL_KEEPALIVE_EXPIRY),
+                )
             ),
-            user_agent=os.getenv('MCP_REGISTRY_USER_AGENT', DEFAULT_USER_AGENT),
             max_retries=int(
-                os.getenv('MCP_REGISTRY_MAX_RETRIES', str(DEFAULT_MAX_RETRIES))
+                os.getenv('MCP_REGISTRY_MAX_RETRIES', str(constants.DEFAULT_MAX_RETRIES))
             ),
             retry_delay=float(
-                os.getenv('MCP_REGISTRY_RETRY_DELAY', str(DEFAULT_RETRY_DELAY))
+                os.getenv('MCP_REGISTRY_RETRY_DELAY', str(constants.DEFAULT_RETRY_DELAY))
             ),
             backoff_factor=float(
-                os.getenv('MCP_REGISTRY_BACKOFF_FACTOR', str(DEFAULT_BACKOFF_FACTOR))
+                os.getenv(
+                    'MCP_REGISTRY_BACKOFF_FACTOR', str(constants.DEFAULT_BACKOFF_FACTOR)
+                )
+            ),
+            cache_ttl=int(
+                os.getenv('MCP_REGISTRY_CACHE_TTL', str(constants.DEFAULT_CACHE_TTL))
+            ),
+            cache_max_size=int(
+                os.getenv(
+                    'MCP_REGISTRY_CACHE_MAX_SIZE', str(constants.DEFAULT_CACHE_MAX_SIZE)
+                )
             ),
-            cache_ttl=int(os.getenv('MCP_REGISTRY_CACHE_TTL', str(DEFAULT_CACHE_TTL))),
             enable_cache=os.getenv('MCP_REGISTRY_ENABLE_CACHE', 'true').lower() == 'true',
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CLIConfig:
     """Configuration for the CLI interface."""
 
@@ -131,6 +181,31 @@ class CLIConfig:
         )
 
 
+# Field names accepted as configuration overrides; unknown names are ignored
+_CLIENT_FIELDS = frozenset(field.name for field in fields(ClientConfig))
+_CLI_FIELDS = frozenset(field.name for field in fields(CLIConfig))
+
+
+def _valid_overrides(
+    valid_fields: frozenset[str], kwargs: Mapping[str, object]
+) -> dict[str, Any]:
+    """Select the overrides that name a known field and carry a value.
+
+    Args:
+        valid_fields: Field names of the configuration class
+        kwargs: Requested overrides
+
+    Returns:
+        Overrides to apply
+
+    """
+    return {
+        key: value
+        for key, value in kwargs.items()
+        if key in valid_fields and value is not None
+    }
+
+
 def get_client_config(
     base_url: str | None = None,
     timeout: float | None = None,
@@ -147,18 +222,14 @@ def get_client_config(
         ClientConfig instance
 
     """
-    config = ClientConfig.from_env()
-
+    overrides = _valid_overrides(_CLIENT_FIELDS, kwargs)
     if base_url is not None:
-        config.base_url = base_url
+        overrides['base_url'] = base_url
     if timeout is not None:
-        config.timeout = timeout
-
-    for key, value in kwargs.items():
-        if hasattr(config, key) and value is not None:
-            setattr(config, key, value)
+        overrides['timeout'] = timeout
 
-    return config
+    config = ClientConfig.from_env()
+    return replace(config, **overrides) if overrides else config
 
 
 def get_cli_config(**kwargs: str | int) -> CLIConfig:
@@ -171,10 +242,7 @@ def get_cli_config(**kwargs: str | int) -> CLIConfig:
         CLIConfig instance
 
     """
-    config = CLIConfig.from_env()
+    overrides = _valid_overrides(_CLI_FIELDS, kwargs)
 
-    for key, value in kwargs.items():
-        if hasattr(config, key) and value is not None:
-            setattr(config, key, value)
-
-    return config
+    config = CLIConfig.from_env()
+    return replace(config, **overrides) if overrides else config
@@ -1,7 +1,9 @@
 """Constants for the MCP registry client."""
 
-import tomllib
+import os
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # HTTP status codes
 HTTP_OK = 200
@@ -16,35 +18,106 @@ HTTP_BAD_GATEWAY = 502
 HTTP_SERVICE_UNAVAILABLE = 503
 HTTP_GATEWAY_TIMEOUT = 504
 
+# Status codes that signal a transient failure worth retrying
+RETRYABLE_STATUS_CODES = frozenset(
+    {
+        HTTP_TOO_MANY_REQUESTS,
+        HTTP_INTERNAL_SERVER_ERROR,
+        HTTP_BAD_GATEWAY,
+        HTTP_SERVICE_UNAVAILABLE,
+        HTTP_GATEWAY_TIMEOUT,
+    }
+)
 
-def _load_config() -> dict:
-    """Load configuration from config.toml file."""
-    config_path = Path(__file__).parent.parent / 'config.toml'
-    if config_path.exists():
-        with config_path.open('rb') as f:
-            return tomllib.load(f)
-    return {}
+# Longest excerpt of a non-JSON error body included in error messages
+ERROR_BODY_MAX_BYTES = 512
 
 
-# Load configuration
-_config = _load_config()
-_client_config = _config.get('client', {})
+# Default configuration values, as (config.toml key, fallback) pairs. They are
+# resolved on first access so that importing this module never touches the
+# filesystem or imports tomllib unless a default is actually needed.
+_CLIENT_DEFAULTS: dict[str, tuple[str, Any]] = {
+    'DEFAULT_BASE_URL': ('base_url', 'https://registry.modelcontextprotocol.io'),
+    'DEFAULT_TIMEOUT': ('timeout', 30.0),
+    'DEFAULT_CONNECT_TIMEOUT': ('connect_timeout', 10.0),
+    'DEFAULT_READ_TIMEOUT': ('read_timeout', 30.0),
+    'DEFAULT_WRITE_TIMEOUT': ('write_timeout', 10.0),
+    'DEFAULT_POOL_TIMEOUT': ('pool_timeout', 5.0),
+    'DEFAULT_USER_AGENT': ('user_agent', 'mcp-registry-client/0.1.0'),
+    # Connection pool configuration
+    'DEFAULT_POOL_MAX_CONNECTIONS': ('pool_max_connections', 100),
+    'DEFAULT_POOL_MAX_KEEPALIVE': ('pool_max_keepalive', 20),
+    'DEFAULT_POOL_KEEPALIVE_EXPIRY': ('pool_keepalive_expiry', 30.0),
+    # Request retry configuration
+    'DEFAULT_MAX_RETRIES': ('max_retries', 3),
+    'DEFAULT_RETRY_DELAY': ('retry_delay', 1.0),
+    'DEFAULT_BACKOFF_FACTOR': ('backoff_factor', 2.0),
+    # Response caching configuration
+    'DEFAULT_CACHE_TTL': ('cache_ttl', 300),  # 5 minutes in seconds
+    'DEFAULT_CACHE_MAX_SIZE': ('cache_max_size', 1024),  # entries
+}
 
-# Default configuration values with fallbacks
-DEFAULT_BASE_URL = _client_config.get(
-    'base_url', 'https://registry.modelcontextprotocol.io'
-)
-DEFAULT_TIMEOUT = _client_config.get('timeout', 30.0)
-DEFAULT_CONNECT_TIMEOUT = _client_config.get('connect_timeout', 10.0)
-DEFAULT_READ_TIMEOUT = _client_config.get('read_timeout', 30.0)
-DEFAULT_WRITE_TIMEOUT = _client_config.get('write_timeout', 10.0)
-DEFAULT_POOL_TIMEOUT = _client_config.get('pool_timeout', 5.0)
-DEFAULT_USER_AGENT = _client_config.get('user_agent', 'mcp-registry-client/0.1.0')
-
-# Request retry configuration
-DEFAULT_MAX_RETRIES = _client_config.get('max_retries', 3)
-DEFAULT_RETRY_DELAY = _client_config.get('retry_delay', 1.0)
-DEFAULT_BACKOFF_FACTOR = _client_config.get('backoff_factor', 2.0)
-
-# Response caching configuration
-DEFAULT_CACHE_TTL = _client_config.get('cache_ttl', 300)  # 5 minutes in seconds
+if TYPE_CHECKING:
+    DEFAULT_BASE_URL: str
+    DEFAULT_TIMEOUT: float
+    DEFAULT_CONNECT_TIMEOUT: float
+    DEFAULT_READ_TIMEOUT: float
+    DEFAULT_WRITE_TIMEOUT: float
+    DEFAULT_POOL_TIMEOUT: float
+    DEFAULT_USER_AGENT: str
+    DEFAULT_POOL_MAX_CONNECTIONS: int
+    DEFAULT_POOL_MAX_KEEPALIVE: int
+    DEFAULT_POOL_KEEPALIVE_EXPIRY: float
+    DEFAULT_MAX_RETRIES: int
+    DEFAULT_RETRY_DELAY: float
+    DEFAULT_BACKOFF_FACTOR: float
+    DEFAULT_CACHE_TTL: int
+    DEFAULT_CACHE_MAX_SIZE: int
+
+
+@cache
+def _load_client_config() -> dict[str, Any]:
+    """Load the client section of the config.toml file, if there is one.
+
+    The file named by MCP_CONFIG_TOML is used when that variable is set, and the
+    config.toml next to the package otherwise.
+
+    Raises:
+        FileNotFoundError: If MCP_CONFIG_TOML names a path that is not a file
+        ValueError: If the config file is not valid TOML
+
+    """
+    env_path = os.environ.get('MCP_CONFIG_TOML')
+    if env_path:
+        config_path = Path(env_path)
+        if not config_path.is_file():
+            # An explicitly chosen file must exist, so a typo is not silently ignored
+            msg = f'MCP_CONFIG_TOML is set to {env_path!r}, which is not a file'
+            raise FileNotFoundError(msg)
+    else:
+        config_path = Path(__file__).parent.parent / 'config.toml'
+        if not config_path.is_file():
+            return {}
+
+    import tomllib  # noqa: PLC0415
+
+    with config_path.open('rb') as f:
+        try:
+            config: dict[str, Any] = tomllib.load(f).get('client', {})
+        except tomllib.TOMLDecodeError as e:
+            msg = f'Config file {str(config_path)!r} is not valid TOML: {e}'
+            raise ValueError(msg) from e
+    return config
+
+
+def __getattr__(name: str) -> object:
+    """Resolve a default configuration value on first attribute access."""
+    default = _CLIENT_DEFAULTS.get(name)
+    if default is None:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+
+    key, fallback = default
+    value = _load_client_config().get(key, fallback)
+    globals()[name] = value
+    return value
@@ -1,6 +1,8 @@
 """Error handling utilities for the MCP registry client."""
 
 import logging
+from collections.abc import Callable
+from functools import lru_cache
 
 from .client import RegistryAPIError, RegistryClientError
 from .constants import HTTP_INTERNAL_SERVER_ERROR, HTTP_NOT_FOUND
@@ -9,6 +11,56 @@ from .formatters import print_error
 logger = logging.getLogger(__name__)
 
 
+def _handle_api_error(exc: Exception, suffix: str) -> None:
+    """Report a registry API error."""
+    status_code = getattr(exc, 'status_code', None)
+    if status_code is None:
+        print_error(f'Error: API request failed{suffix}')
+    elif status_code == HTTP_NOT_FOUND:
+        print_error(f'Error: Server not found{suffix}')
+    elif status_code >= HTTP_INTERNAL_SERVER_ERROR:
+        print_error('Error: Registry service unavailable. Please try again later.')
+    else:
+        print_error(f'Error: API request failed (HTTP {status_code})')
+    logger.debug('API error details: %s', exc)
+
+
+def _handle_client_error(exc: Exception, suffix: str) -> None:
+    """Report an error processing a registry response."""
+    print_error(f'Error: Failed to process response{suffix}')
+    logger.debug('Client error details: %s', exc)
+
+
+def _handle_file_error(exc: Exception, _suffix: str) -> None:
+    """Report a missing file, such as a config file named by MCP_CONFIG_TOML."""
+    print_error(f'Error: {exc}')
+    logger.debug('File error details: %r', exc)
+
+
+def _handle_unexpected_error(_exc: Exception, suffix: str) -> None:
+    """Report an error of any other type."""
+    print_error(f'Error: Unexpected error occurred{suffix}')
+    logger.exception('Unexpected error')
+
+
+@lru_cache(maxsize=32)
+def _context_suffix(context: str) -> str:
+    """Format the message suffix for an operation context.
+
+    Commands pass one of a handful of fixed contexts, so the suffixes are cached
+    rather than rebuilt for every error.
+    """
+    return f' ({context})' if context else ''
+
+
+# Handlers by exception type; subclasses resolve through their MRO
+_ERROR_HANDLERS: dict[type[BaseException], Callable[[Exception, str], None]] = {
+    RegistryAPIError: _handle_api_error,
+    RegistryClientError: _handle_client_error,
+    FileNotFoundError: _handle_file_error,
+}
+
+
 def handle_command_error(exc: Exception, context: str = '') -> int:
     """Handle command errors with consistent messaging and logging.
 
@@ -20,24 +72,14 @@ def handle_command_error(exc: Exception, context: str = '') -> int:
         Appropriate exit code for the error type
 
     """
-    if isinstance(exc, RegistryAPIError):
-        if hasattr(exc, 'status_code') and exc.status_code is not None:
-            if exc.status_code == HTTP_NOT_FOUND:
-                print_error(f'Error: Server not found{f" ({context})" if context else ""}')
-            elif exc.status_code >= HTTP_INTERNAL_SERVER_ERROR:
-                print_error('Error: Registry service unavailable. Please try again later.')
-            else:
-                print_error(f'Error: API request failed (HTTP {exc.status_code})')
-        else:
-            print_error(f'Error: API request failed{f" ({context})" if context else ""}')
-        logger.debug('API error details: %s', exc)
-        return 1
-    if isinstance(exc, RegistryClientError):
-        print_error(
-            f'Error: Failed to process response{f" ({context})" if context else ""}'
-        )
-        logger.debug('Client error details: %s', exc)
-        return 1
-    print_error(f'Error: Unexpected error occurred{f" ({context})" if context else ""}')
-    logger.exception('Unexpected error')
+    suffix = _context_suffix(context)
+
+    handler: Callable[[Exception, str], None] = _handle_unexpected_error
+    for exc_type in type(exc).__mro__:
+        registered = _ERROR_HANDLERS.get(exc_type)
+        if registered is not None:
+            handler = registered
+            break
+
+    handler(exc, suffix)
     return 1
@@ -6,6 +6,9 @@ from typing import Any
 
 from .models import Package, Remote, Server
 
+# Marks a description cut short to fit the table column
+_ELLIPSIS = '...'
+
 
 def format_env_variables(package: Package) -> list[dict[str, Any]]:
     """Format environment variables for a package."""
@@ -101,9 +104,15 @@ def format_server_detailed(server: Server) -> dict[str, Any]:
     return data
 
 
+def _emit(lines: list[str]) -> None:
+    """Write output lines to stdout with a single write call."""
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+
+
 def print_json(data: dict[str, Any] | list[dict[str, Any]], *, indent: int = 2) -> None:
     """Print data as formatted JSON."""
-    print(json.dumps(data, indent=indent))  # noqa: T201
+    _emit([json.dumps(data, indent=indent)])
 
 
 def print_table(servers: list[Server], max_description_width: int = 60) -> None:
@@ -118,50 +127,60 @@ def print_table(servers: list[Server], max_description_width: int = 60) -> None:
         print('No servers found.')  # noqa: T201
         return
 
-    # Calculate column widths
-    name_width = max(len('NAME'), *(len(s.name) for s in servers))
-    desc_width = min(
-        max_description_width,
-        max(len('DESCRIPTION'), *(len(s.description) for s in servers)),
-    )
-    version_width = max(len('VERSION'), *(len(s.version) for s in servers))
+    # Calculate column widths in a single pass over the servers
+    name_width = len('NAME')
+    longest_desc = len('DESCRIPTION')
+    version_width = len('VERSION')
+    for server in servers:
+        name_width = max(name_width, len(server.name))
+        longest_desc = max(longest_desc, len(server.description))
+        version_width = max(version_width, len(server.version))
+    desc_width = min(max_description_width, longest_desc)
+
+    # Skip the per-row length check entirely when every description fits
+    truncate = longest_desc > desc_width
+    truncated_len = desc_width - len(_ELLIPSIS)
 
-    # Print header
     header = (
-        f'{"NAME":<{name_width}} {"DESCRIPTION":<{desc_width}} {"VERSION":<{version_width}}'
+        f'{"NAME".ljust(name_width)} {"DESCRIPTION".ljust(desc_width)} '
+        f'{"VERSION".ljust(version_width)}'
     )
-    print(header)  # noqa: T201
-    print('-' * len(header))  # noqa: T201
+    lines = [header, '-' * len(header)]
 
-    # Print servers
     for server in servers:
         desc = server.description
-        if len(desc) > desc_width:
-            desc = desc[: desc_width - 3] + '...'
+        if truncate and len(desc) > desc_width:
+            desc = desc[:truncated_len] + _ELLIPSIS
 
-        print(  # noqa: T201
-            f'{server.name:<{name_width}} {desc:<{desc_width}} '
-            f'{server.version:<{version_width}}'
+        lines.append(
+            f'{server.name.ljust(name_width)} {desc.ljust(desc_width)} '
+            f'{server.version.ljust(version_width)}'
         )
 
+    _emit(lines)
+
 
 def print_server_info_human_readable(server: Server) -> None:
     """Print server information in human-readable format."""
-    print(f'Name: {server.name}')  # noqa: T201
-    print(f'Description: {server.description}')  # noqa: T201
-    print(f'Version: {server.version}')  # noqa: T201
-    print(f'Status: {server.status or "unknown"}')  # noqa: T201
-    print(f'Repository: {server.repository.url if server.repository.url else "N/A"}')  # noqa: T201
+    lines = [
+        f'Name: {server.name}',
+        f'Description: {server.description}',
+        f'Version: {server.version}',
+        f'Status: {server.status or "unknown"}',
+        f'Repository: {server.repository.url if server.repository.url else "N/A"}',
+    ]
 
     if server.remotes:
-        print('\nRemotes:')  # noqa: T201
-        for remote in server.remotes:
-            print(f'  - {remote.type_}: {remote.url}')  # noqa: T201
+        lines.append('\nRemotes:')
+        lines.extend(f'  - {remote.type_}: {remote.url}' for remote in server.remotes)
 
     if server.packages:
-        print('\nPackages:')  # noqa: T201
-        for package in server.packages:
-            print(f'  - {package.identifier} ({package.version})')  # noqa: T201
+        lines.append('\nPackages:')
+        lines.extend(
+            f'  - {package.identifier} ({package.version})' for package in server.packages
+        )
+
+    _emit(lines)
 
 
 def print_error(message: str) -> None:
@@ -115,6 +115,28 @@ class SearchResponse(BaseModel):
 
     servers: list[Server]
 
+    def find_server(self, name: str) -> Server | None:
+        """Find a server by exact name, else by case-insensitive partial match.
+
+        Args:
+            name: The server name to look for
+
+        Returns:
+            The exact match, else the first partial match, else None
+
+        """
+        # A single pass over the current servers, so nothing can go stale when
+        # the list is replaced
+        needle = name.lower()
+        partial: Server | None = None
+        for server in self.servers:
+            if server.name == name:
+                return server
+            if partial is None and needle in server.name.lower():
+                partial = server
+
+        return partial
+
 
 class RegistryError(BaseModel):
     """Error response from the registry API."""
@@ -8,12 +8,20 @@ from typing import TypeVar
 import httpx
 
 from .config import ClientConfig
-from .constants import HTTP_INTERNAL_SERVER_ERROR, HTTP_TOO_MANY_REQUESTS
+from .constants import RETRYABLE_STATUS_CODES
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Exceptions that are passed to the retry strategy rather than raised directly
+_RETRYABLE_EXCEPTIONS = (
+    httpx.RequestError,
+    httpx.HTTPStatusError,
+    OSError,
+    TimeoutError,
+)
+
 
 class RetryStrategy:
     """Retry strategy for network requests."""
@@ -28,6 +36,12 @@ class RetryStrategy:
         self.max_retries = config.max_retries
         self.retry_delay = config.retry_delay
         self.backoff_factor = config.backoff_factor
+        # Every attempt that can be retried is known up front, so compute the
+        # backoff schedule once instead of on each failure
+        self._delays = tuple(
+            self.retry_delay * (self.backoff_factor**attempt)
+            for attempt in range(self.max_retries)
+        )
 
     def should_retry(self, attempt: int, exception: Exception) -> bool:
         """Determine if a request should be retried.
@@ -48,12 +62,8 @@ class RetryStrategy:
             return True
 
         if isinstance(exception, httpx.HTTPStatusError):
-            # Retry on server errors (5xx) and rate limiting (429)
-            status_code = exception.response.status_code
-            return (
-                status_code >= HTTP_INTERNAL_SERVER_ERROR
-                or status_code == HTTP_TOO_MANY_REQUESTS
-            )
+            # Retry on transient server errors and rate limiting (429)
+            return exception.response.status_code in RETRYABLE_STATUS_CODES
 
         return False
 
@@ -67,6 +77,9 @@ class RetryStrategy:
             Delay in seconds
 
         """
+        if 0 <= attempt < len(self._delays):
+            return self._delays[attempt]
+
         return self.retry_delay * (self.backoff_factor**attempt)
 
 
@@ -89,53 +102,73 @@ async def with_retry[T](
         Exception: The last exception if all retries are exhausted
 
     """
-    last_exception = None
+    # Most calls succeed first time, so only set up the retry loop on failure
+    try:
+        return await func()
+    except _RETRYABLE_EXCEPTIONS as e:
+        return await _retry(func, strategy, operation_name, e)
+
+
+async def _retry[T](
+    func: Callable[[], Awaitable[T]],
+    strategy: RetryStrategy,
+    operation_name: str,
+    exception: Exception,
+) -> T:
+    """Retry an async function whose first attempt failed.
+
+    Args:
+        func: Async function to execute
+        strategy: Retry strategy to use
+        operation_name: Name of the operation for logging
+        exception: The exception raised by the first attempt
+
+    Returns:
+        Result of the first successful retry
+
+    Raises:
+        Exception: The last exception if all retries are exhausted
+
+    """
+    max_retries = strategy.max_retries
+    max_attempts = max_retries + 1
+    should_retry = strategy.should_retry
+
+    for attempt in range(max_attempts):
+        if not should_retry(attempt, exception):
+            logger.debug(
+                '%s failed on attempt %d/%d, not retrying: %s',
+                operation_name,
+                attempt + 1,
+                max_attempts,
+                exception,
+            )
+            break
+
+        if attempt >= max_retries:
+            logger.debug(
+                '%s failed on final attempt %d/%d: %s',
+                operation_name,
+                attempt + 1,
+                max_attempts,
+                exception,
+            )
+            break
+
+        delay = strategy.get_delay(attempt)
+        logger.debug(
+            '%s failed on attempt %d/%d, retrying in %.2fs: %s',
+            operation_name,
+            attempt + 1,
+            max_attempts,
+            delay,
+            exception,
+        )
+        await asyncio.sleep(delay)
 
-    for attempt in range(strategy.max_retries + 1):
         try:
             return await func()
-        except (
-            httpx.RequestError,
-            httpx.HTTPStatusError,
-            OSError,
-            TimeoutError,
-        ) as e:
-            last_exception = e
-
-            if not strategy.should_retry(attempt, e):
-                logger.debug(
-                    '%s failed on attempt %d/%d, not retrying: %s',
-                    operation_name,
-                    attempt + 1,
-                    strategy.max_retries + 1,
-                    e,
-                )
-                break
-
-            if attempt < strategy.max_retries:
-                delay = strategy.get_delay(attempt)
-                logger.debug(
-                    '%s failed on attempt %d/%d, retrying in %.2fs: %s',
-                    operation_name,
-                    attempt + 1,
-                    strategy.max_retries + 1,
-                    delay,
-                    e,
-                )
-                await asyncio.sleep(delay)
-            else:
-                logger.debug(
-                    '%s failed on final attempt %d/%d: %s',
-                    operation_name,
-                    attempt + 1,
-                    strategy.max_retries + 1,
-                    e,
-                )
-
-    # Re-raise the last exception
-    if last_exception is not None:
-        raise last_exception
-
-    # This should never happen, but satisfy type checker
-    msg = f'{operation_name} failed with no exception recorded'
-    raise RuntimeError(msg)
+        except _RETRYABLE_EXCEPTIONS as e:
+            exception = e
+
+    raise exception
@@ -1,53 +1,54 @@
 """Input validation helpers for CLI commands."""
 
 
-def validate_non_empty_string(value: str, field_name: str) -> None:
+def validate_non_empty_string(value: str, field_name: str) -> str:
     """Validate that a string is non-empty after stripping whitespace.
 
     Args:
         value: The string value to validate
         field_name: Name of the field for error messages
 
+    Returns:
+        The value with surrounding whitespace stripped
+
     Raises:
         ValueError: If the string is empty or only whitespace
 
     """
-    if not value or not value.strip():
+    stripped = value.strip()
+    if not stripped:
         msg = f'{field_name} cannot be empty'
         raise ValueError(msg)
+    return stripped
 
 
-def validate_search_term(search_term: str) -> None:
+def validate_search_term(search_term: str) -> str:
     """Validate search term for server search.
 
     Args:
         search_term: The search term to validate
 
+    Returns:
+        The search term with surrounding whitespace stripped
+
     Raises:
         ValueError: If search term is invalid
 
     """
-    validate_non_empty_string(search_term, 'Search term')
-
-    # Additional validation rules can be added here
-    if len(search_term.strip()) < 1:
-        msg = 'Search term must be at least 1 character long'
-        raise ValueError(msg)
+    return validate_non_empty_string(search_term, 'Search term')
 
 
-def validate_server_name(server_name: str) -> None:
+def validate_server_name(server_name: str) -> str:
     """Validate server name for info retrieval.
 
     Args:
         server_name: The server name to validate
 
+    Returns:
+        The server name with surrounding whitespace stripped
+
     Raises:
         ValueError: If server name is invalid
 
     """
-    validate_non_empty_string(server_name, 'Server name')
-
-    # Additional validation rules can be added here
-    if len(server_name.strip()) < 1:
-        msg = 'Server name must be at least 1 character long'
-        raise ValueError(msg)
+    return validate_non_empty_string(server_name, 'Server name')
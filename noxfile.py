@@ -48,6 +48,13 @@ def tests(session) -> None:
     session.run('pytest', '-m', 'not benchmark')
 
 
+@nox.session(default=False)
+def integration_tests(session) -> None:
+    """Run the integration tests in parallel, one worker per test file."""
+    session.install('.[dev]')
+    session.run('pytest', '-m', 'integration', '-n', 'auto', '--dist', 'loadfile')
+
+
 @nox.session
 def docs(session) -> None:
     """Build documentation."""
@@ -2,6 +2,21 @@
 
 import pytest
 
+from .rate_limit import ApiRateLimiter
+
+
+@pytest.fixture(scope='session')
+def api_rate_limiter(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> ApiRateLimiter:
+    """Rate limiter for real API calls, shared by all tests and workers of a run."""
+    # Under pytest-xdist each worker has its own base temp directory; their parent
+    # is common to the run and private to the user
+    root = tmp_path_factory.getbasetemp()
+    if hasattr(request.config, 'workerinput'):
+        root = root.parent
+    return ApiRateLimiter(root / 'api-rate-limit')
+
 
 def pytest_configure(config):
     """Configure pytest for integration tests."""
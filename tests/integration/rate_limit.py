@@ -0,0 +1,71 @@
+"""Rate limiting for integration tests that call the real registry API."""
+
+import asyncio
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+# Minimum time between calls to the real registry API, in seconds, across all
+# integration tests and test processes (e.g. pytest-xdist workers)
+MIN_API_CALL_INTERVAL = 2.0
+
+
+class ApiRateLimiter:
+    """Rate limiter shared by every process of one test run.
+
+    The time of the next free call slot is kept in a file. A slot is reserved
+    while holding an exclusive lock on that file, but the wait happens after
+    releasing it, so other processes can reserve the following slots meanwhile.
+    """
+
+    def __init__(self, path: Path, min_interval: float = MIN_API_CALL_INTERVAL) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            path: File holding the next free slot, shared by the test processes
+            min_interval: Minimum time between calls in seconds
+
+        """
+        self._path = path
+        self._min_interval = min_interval
+
+    def _reserve(self) -> float:
+        """Reserve the next call slot and get how long to wait for it."""
+        with self._path.open('a+') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    next_slot = float(f.read())
+                except ValueError:  # Empty, partially written or corrupt
+                    next_slot = float('-inf')
+                # The monotonic clock is system-wide, so it is comparable across
+                # processes, and unlike wall-clock time it never jumps
+                now = time.monotonic()
+                call_time = max(now, next_slot)
+                f.seek(0)
+                f.truncate()
+                f.write(repr(call_time + self._min_interval))
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+        return call_time - now
+
+    def wait(self) -> None:
+        """Wait for the next call slot."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """Wait for the next call slot without blocking the event loop."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
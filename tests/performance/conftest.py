@@ -0,0 +1,21 @@
+"""Configuration for performance tests."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from mcp_registry_client.cli import event_loop_factory
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(
+    config,  # noqa: ARG001
+    item,  # noqa: ARG001
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async benchmarks on the event loop the CLI uses: uvloop when installed."""
+    factory = event_loop_factory()
+    if factory is None:
+        return {'asyncio': asyncio.new_event_loop}
+
+    return {'uvloop': factory}
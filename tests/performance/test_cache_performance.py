@@ -1,12 +1,14 @@
 """Performance tests for cache functionality."""
 
 import asyncio
-import sys
+import random
 import time
+import tracemalloc
+from unittest.mock import patch
 
 import pytest
 
-from mcp_registry_client.cache import CacheEntry, ResponseCache
+from mcp_registry_client.cache import NANOSECONDS_PER_SECOND, CacheEntry, ResponseCache
 from mcp_registry_client.config import ClientConfig
 
 
@@ -14,9 +16,10 @@ from mcp_registry_client.config import ClientConfig
 class TestCachePerformance:
     """Performance benchmarks for cache operations."""
 
-    @pytest.fixture
-    def config(self) -> ClientConfig:
-        """Create test configuration."""
+    @pytest.fixture(scope='class')
+    @classmethod
+    def config(cls) -> ClientConfig:
+        """Create test configuration, shared by the class since no test changes it."""
         config = ClientConfig()
         config.cache_ttl = 300  # 5 minutes
         config.enable_cache = True
@@ -29,17 +32,9 @@ class TestCachePerformance:
 
     def test_cache_set_performance(self, benchmark, cache: ResponseCache) -> None:
         """Benchmark cache set operations."""
-
-        async def set_operation() -> None:
-            await cache.set('test-key', 'test-value')
-
-        def setup() -> tuple[tuple, dict]:
-            return (), {}
-
-        # Benchmark the async operation
         benchmark.pedantic(
-            lambda: asyncio.run(set_operation()),
-            setup=setup,
+            cache.set,
+            args=('test-key', 'test-value'),
             rounds=100,
             iterations=1,
         )
@@ -47,18 +42,11 @@ class TestCachePerformance:
     def test_cache_get_performance(self, benchmark, cache: ResponseCache) -> None:
         """Benchmark cache get operations."""
         # Pre-populate cache
-        asyncio.run(cache.set('test-key', 'test-value'))
-
-        async def get_operation() -> str | None:
-            return await cache.get('test-key')
-
-        def setup() -> tuple[tuple, dict]:
-            return (), {}
+        cache.set('test-key', 'test-value')
 
-        # Benchmark the async operation
         result = benchmark.pedantic(
-            lambda: asyncio.run(get_operation()),
-            setup=setup,
+            cache.get,
+            args=('test-key',),
             rounds=100,
             iterations=1,
         )
@@ -66,17 +54,9 @@ class TestCachePerformance:
 
     def test_cache_miss_performance(self, benchmark, cache: ResponseCache) -> None:
         """Benchmark cache miss operations."""
-
-        async def get_missing_operation() -> str | None:
-            return await cache.get('nonexistent-key')
-
-        def setup() -> tuple[tuple, dict]:
-            return (), {}
-
-        # Benchmark the async operation
         result = benchmark.pedantic(
-            lambda: asyncio.run(get_missing_operation()),
-            setup=setup,
+            cache.get,
+            args=('nonexistent-key',),
             rounds=100,
             iterations=1,
         )
@@ -92,30 +72,30 @@ class TestCachePerformance:
         values = [f'value-{i}' for i in range(num_operations)]
 
         # Measure time for concurrent set operations
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         async def set_value(key: str, value: str) -> None:
-            await cache.set(key, value)
+            cache.set(key, value)
 
         # Run concurrent sets
-        await asyncio.gather(*[set_value(k, v) for k, v in zip(keys, values, strict=True)])
+        await asyncio.gather(*map(set_value, keys, values))
 
-        set_time = time.time() - start_time
+        set_time = time.perf_counter() - start_time
 
         # Measure time for concurrent get operations
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         async def get_value(key: str) -> str | None:
-            return await cache.get(key)
+            return cache.get(key)
 
         # Run concurrent gets
-        results = await asyncio.gather(*[get_value(k) for k in keys])
+        results = await asyncio.gather(*map(get_value, keys))
 
-        get_time = time.time() - start_time
+        get_time = time.perf_counter() - start_time
 
         # Verify all operations completed successfully
         assert len(results) == num_operations
-        assert all(r is not None for r in results)
+        assert None not in results
 
         # Performance assertions (these are somewhat arbitrary but reasonable)
         assert set_time < 5.0, f'Concurrent sets took too long: {set_time:.2f}s'
@@ -124,25 +104,20 @@ class TestCachePerformance:
         # Verify cache contains all items
         assert len(cache._cache) == num_operations
 
-    @pytest.mark.asyncio
-    async def test_cache_cleanup_performance(self, cache: ResponseCache) -> None:
+    def test_cache_cleanup_performance(self, cache: ResponseCache) -> None:
         """Test performance of cache cleanup operations."""
         # Pre-populate cache with expired items
         num_items = 1000
 
-        # Add items with very short TTL that will expire immediately
-
-        for i in range(num_items):
-            # Create expired cache entries
-            entry = CacheEntry(
-                f'value-{i}', ttl=-1
-            )  # Negative TTL makes it immediately expired
-            cache._cache[f'key-{i}'] = entry
+        # Insert expired entries in bulk; a negative TTL makes them expire immediately
+        cache._cache.update(
+            {f'key-{i}': CacheEntry(f'value-{i}', ttl=-1) for i in range(num_items)}
+        )
 
         # Measure cleanup time
-        start_time = time.time()
-        await cache.cleanup_expired()
-        cleanup_time = time.time() - start_time
+        start_time = time.perf_counter()
+        cache.cleanup_expired()
+        cleanup_time = time.perf_counter() - start_time
 
         # Should complete quickly even with many expired items
         assert cleanup_time < 1.0, f'Cleanup took too long: {cleanup_time:.2f}s'
@@ -152,22 +127,29 @@ class TestCachePerformance:
 
     def test_cache_memory_usage_pattern(self, cache: ResponseCache) -> None:
         """Test cache memory usage patterns."""
-        # Measure baseline memory
-        baseline_size = sys.getsizeof(cache._cache)
-
-        # Add many items to cache
-        num_items = 10000
-        for i in range(num_items):
-            asyncio.run(cache.set(f'key-{i}', f'value-{i}' * 100))  # Larger values
-
-        # Measure cache size after population
-        populated_size = sys.getsizeof(cache._cache)
-
-        # Calculate memory per item (rough estimate)
-        memory_per_item = (populated_size - baseline_size) / num_items
+        # Stay within the LRU bound so every item is retained
+        num_items = cache.max_size
+
+        # Build keys and values up front so only the memory the cache itself
+        # allocates for its entries and index is measured
+        keys = [f'key-{i}' for i in range(num_items)]
+        values = [f'value-{i}' * 100 for i in range(num_items)]  # Larger values
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            for key, value in zip(keys, values, strict=True):
+                cache.set(key, value)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        memory_per_item = allocated / num_items
 
+        assert len(cache._cache) == num_items
         # Should be reasonable memory usage per item
-        assert memory_per_item < 1000, f'Memory per item too high: {memory_per_item} bytes'
+        assert memory_per_item < 500, f'Memory per item too high: {memory_per_item} bytes'
 
     @pytest.mark.asyncio
     async def test_cache_ttl_expiration_performance(self, cache: ResponseCache) -> None:
@@ -177,21 +159,21 @@ class TestCachePerformance:
 
         num_items = 100
         for i in range(num_items):
-            await cache.set(f'key-{i}', f'value-{i}')
+            cache.set(f'key-{i}', f'value-{i}')
 
         # All items should be present initially
         assert len(cache._cache) == num_items
 
-        # Wait for expiration
-        await asyncio.sleep(1.1)
+        # Move the cache's monotonic clock past the TTL instead of sleeping
+        expired_ns = time.monotonic_ns() + 2 * NANOSECONDS_PER_SECOND
+        with patch('time.monotonic_ns', return_value=expired_ns):
+            # Measure time to detect and handle expiration
+            start_time = time.perf_counter()
 
-        # Measure time to detect and handle expiration
-        start_time = time.time()
+            # Accessing any key should trigger cleanup of expired items
+            result = cache.get('key-0')
 
-        # Accessing any key should trigger cleanup of expired items
-        result = await cache.get('key-0')
-
-        expiration_time = time.time() - start_time
+            expiration_time = time.perf_counter() - start_time
 
         # Should handle expiration quickly
         assert expiration_time < 0.5, (
@@ -200,3 +182,59 @@ class TestCachePerformance:
 
         # Item should be expired (None result)
         assert result is None
+
+
+@pytest.mark.benchmark
+class TestCacheSizing:
+    """Hit ratio and memory of cache configurations on a skewed search workload."""
+
+    NUM_LOOKUPS = 5000
+
+    @pytest.fixture(scope='class')
+    @classmethod
+    def search_keys(cls) -> list[str]:
+        """Create a reproducible lookup sequence with a few popular search terms."""
+        rng = random.Random(0)  # noqa: S311
+        # Pareto-distributed term IDs: a small hot set and a long tail of rare terms
+        return [f'search:{int(rng.paretovariate(0.5))}' for _ in range(cls.NUM_LOOKUPS)]
+
+    @pytest.mark.parametrize('cache_ttl', [30, 60, 300])
+    @pytest.mark.parametrize('max_size', [50, 100, 200])
+    def test_cache_sizing_hit_ratio(
+        self, search_keys: list[str], cache_ttl: int, max_size: int, record_property
+    ) -> None:
+        """Test the hit ratio and peak memory of a TTL and size combination.
+
+        Lookups arrive one per simulated second, and a miss fills the entry as the
+        client would. The hit ratio and peak traced memory are recorded as test
+        properties so configurations can be compared across the sweep.
+        """
+        cache = ResponseCache(
+            ClientConfig(cache_ttl=cache_ttl, cache_max_size=max_size, enable_cache=True)
+        )
+        value = 'x' * 200
+        clock_ns = time.monotonic_ns()
+        hits = 0
+
+        tracemalloc.start()
+        try:
+            with patch('time.monotonic_ns', new=lambda: clock_ns):
+                for key in search_keys:
+                    clock_ns += NANOSECONDS_PER_SECOND
+                    if cache.get(key) is None:
+                        cache.set(key, value)
+                    else:
+                        hits += 1
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        hit_ratio = hits / len(search_keys)
+        record_property('hit_ratio', round(hit_ratio, 3))
+        record_property('peak_bytes', peak)
+
+        # The LRU bound holds however quickly entries expire
+        assert len(cache._cache) <= max_size
+        # Popular terms are looked up far more often than any TTL, so they hit
+        assert hit_ratio > 0.5, f'Hit ratio too low: {hit_ratio:.3f}'
+        assert peak / max_size < 500, f'Memory per entry too high: {peak / max_size}'
@@ -3,8 +3,13 @@
 import asyncio
 import gc
 import time
+from collections import defaultdict
+from collections.abc import Iterator
+from functools import partial
 from typing import Never
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from mcp_registry_client.config import ClientConfig
@@ -29,6 +34,12 @@ class TestRetryPerformance:
         """Create test retry strategy."""
         return RetryStrategy(config)
 
+    @pytest.fixture
+    def no_backoff_sleep(self) -> Iterator[AsyncMock]:
+        """Skip backoff delays so timings measure only the retry logic itself."""
+        with patch('mcp_registry_client.retry.asyncio.sleep', new=AsyncMock()) as sleep:
+            yield sleep
+
     def test_retry_strategy_initialization_performance(
         self, benchmark, config: ClientConfig
     ) -> None:
@@ -56,9 +67,9 @@ class TestRetryPerformance:
             call_count += 1
             return 'success'
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = await with_retry(successful_operation, retry_strategy)
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
         assert result == 'success'
         assert call_count == 1
@@ -69,7 +80,7 @@ class TestRetryPerformance:
 
     @pytest.mark.asyncio
     async def test_retry_with_eventual_success_performance(
-        self, retry_strategy: RetryStrategy
+        self, retry_strategy: RetryStrategy, no_backoff_sleep: AsyncMock
     ) -> None:
         """Test performance when operation succeeds after retries."""
         call_count = 0
@@ -79,21 +90,24 @@ class TestRetryPerformance:
             call_count += 1
             if call_count < 3:
                 msg = 'Temporary failure'
-                raise ConnectionError(msg)
+                raise httpx.ConnectError(msg)
             return 'success'
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = await with_retry(eventually_successful_operation, retry_strategy)
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
         assert result == 'success'
         assert call_count == 3
+        assert no_backoff_sleep.await_count == 2
 
-        # Should complete within reasonable time including backoff delays
+        # Backoff delays are skipped, so this is retry overhead only
         assert elapsed_time < 0.5, f'Retry operation took too long: {elapsed_time:.3f}s'
 
     @pytest.mark.asyncio
-    async def test_max_retries_performance(self, retry_strategy: RetryStrategy) -> None:
+    async def test_max_retries_performance(
+        self, retry_strategy: RetryStrategy, no_backoff_sleep: AsyncMock
+    ) -> None:
         """Test performance when all retries are exhausted."""
         call_count = 0
 
@@ -101,62 +115,64 @@ class TestRetryPerformance:
             nonlocal call_count
             call_count += 1
             msg = 'Persistent failure'
-            raise ConnectionError(msg)
+            raise httpx.ConnectError(msg)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             await with_retry(always_failing_operation, retry_strategy)
-            pytest.fail('Expected ConnectionError to be raised')
-        except ConnectionError:
+            pytest.fail('Expected httpx.ConnectError to be raised')
+        except httpx.ConnectError:
             pass  # Expected
 
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
         assert call_count == 4  # Initial call + 3 retries
+        assert no_backoff_sleep.await_count == 3
 
-        # Should respect the backoff delays but not take too long
+        # Backoff delays are skipped, so this is retry overhead only
         assert elapsed_time < 0.5, (
             f'Failed retry operation took too long: {elapsed_time:.3f}s'
         )
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures('no_backoff_sleep')
     async def test_concurrent_retry_operations_performance(
         self, retry_strategy: RetryStrategy
     ) -> None:
         """Test performance of concurrent retry operations."""
         num_operations = 20  # Reduced for performance
         success_counts = []
+        call_counts: defaultdict[int, int] = defaultdict(int)
 
         async def sometimes_failing_operation(operation_id: int) -> str:
             # Simulate different failure patterns
             if operation_id % 3 == 0:  # 1/3 fail twice then succeed
-                call_count = getattr(
-                    sometimes_failing_operation, f'count_{operation_id}', 0
-                )
-                call_count += 1
-                setattr(sometimes_failing_operation, f'count_{operation_id}', call_count)
+                call_counts[operation_id] += 1
 
-                if call_count < 3:
+                if call_counts[operation_id] < 3:
                     msg = f'Temporary failure {operation_id}'
-                    raise ConnectionError(msg)
+                    raise httpx.ConnectError(msg)
                 success_counts.append(operation_id)
                 return f'success-{operation_id}'
             # 2/3 succeed immediately
             success_counts.append(operation_id)
             return f'success-{operation_id}'
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Run concurrent retry operations
-        tasks = [
-            with_retry(lambda i=i: sometimes_failing_operation(i), retry_strategy)  # type: ignore[misc]
-            for i in range(num_operations)
-        ]
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    with_retry(partial(sometimes_failing_operation, i), retry_strategy)
+                )
+                for i in range(num_operations)
+            ]
 
-        results = await asyncio.gather(*tasks)
+        results = [task.result() for task in tasks]
 
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
         # All operations should succeed
         assert len(results) == num_operations
@@ -201,8 +217,8 @@ class TestRetryPerformance:
         def make_retry_decisions() -> list[bool]:
             decisions = []
             exceptions = [
-                ConnectionError('Connection failed'),
-                TimeoutError('Request timed out'),
+                httpx.ConnectError('Connection failed'),
+                httpx.ReadTimeout('Request timed out'),
                 ValueError('Invalid value'),  # Should not retry
                 Exception('Generic error'),
             ]
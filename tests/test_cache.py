@@ -1,14 +1,30 @@
 """Tests for the response cache."""
 
 import asyncio
+from contextlib import AbstractContextManager
 from unittest.mock import Mock, patch
 
 import pytest
 
+from mcp_registry_client.cache import NANOSECONDS_PER_SECOND as NS
 from mcp_registry_client.cache import CacheEntry, ResponseCache
 from mcp_registry_client.config import ClientConfig
 
 
+def frozen_clock(now_ns: int) -> AbstractContextManager[object]:
+    """Patch the monotonic clock to always read now_ns."""
+    # A plain function is far cheaper to install than a MagicMock with return_value
+    return patch('time.monotonic_ns', new=lambda: now_ns)
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    """Create an enabled cache with a 300 second TTL and room for 1024 entries."""
+    return ResponseCache(
+        ClientConfig(cache_ttl=300, cache_max_size=1024, enable_cache=True)
+    )
+
+
 class TestCacheEntry:
     """Tests for CacheEntry."""
 
@@ -17,42 +33,39 @@ class TestCacheEntry:
         value = 'test-value'
         ttl = 300
 
-        with patch('time.time', return_value=1000.0):
+        with frozen_clock(1000 * NS):
             entry = CacheEntry(value, ttl)
 
         assert entry.value == value
-        assert entry.expires_at == 1300.0  # 1000 + 300
-
-    def test_is_expired_false(self) -> None:
-        """Test is_expired returns False when not expired."""
-        with patch('time.time', return_value=1000.0):
-            entry = CacheEntry('value', 300)
-
-        # Check before expiration
-        with patch('time.time', return_value=1200.0):  # 100 seconds later
-            assert not entry.is_expired()
-
-    def test_is_expired_true(self) -> None:
-        """Test is_expired returns True when expired."""
-        with patch('time.time', return_value=1000.0):
-            entry = CacheEntry('value', 300)
-
-        # Check after expiration
-        with patch('time.time', return_value=1301.0):  # 301 seconds later
-            assert entry.is_expired()
-
-    def test_is_expired_exact_boundary(self) -> None:
-        """Test is_expired at exact expiration boundary."""
-        with patch('time.time', return_value=1000.0):
-            entry = CacheEntry('value', 300)
-
-        # Check at exact expiration time
-        with patch('time.time', return_value=1300.0):  # Exactly 300 seconds later
-            assert not entry.is_expired()
-
-        # Check just after expiration time
-        with patch('time.time', return_value=1300.1):  # 0.1 seconds after expiration
-            assert entry.is_expired()
+        assert entry.expires_at_ns == 1300 * NS  # 1000 + 300
+
+    def test_uses_slots(self) -> None:
+        """Test cache entries carry no per-instance __dict__."""
+        entry = CacheEntry('value', 300)
+
+        assert not hasattr(entry, '__dict__')
+
+    @pytest.mark.parametrize(
+        'ttl,elapsed_ns,expected',
+        [
+            (300, 200 * NS, False),  # Before expiration
+            (300, 300 * NS, False),  # Exactly at expiration
+            (300, 300 * NS + NS // 10, True),  # Just after expiration
+            (300, 301 * NS, True),  # Well after expiration
+        ],
+    )
+    def test_is_expired(
+        self,
+        ttl: int,
+        elapsed_ns: int,
+        expected: bool,  # noqa: FBT001
+    ) -> None:
+        """Test is_expired around the expiration time."""
+        with frozen_clock(1000 * NS):
+            entry = CacheEntry('value', ttl)
+
+        with frozen_clock(1000 * NS + elapsed_ns):
+            assert entry.is_expired() is expected
 
 
 class TestResponseCache:
@@ -60,185 +73,217 @@ class TestResponseCache:
 
     def test_init_enabled(self) -> None:
         """Test cache initialization when enabled."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 600
+        config = ClientConfig(cache_ttl=600, cache_max_size=1024, enable_cache=True)
 
         cache = ResponseCache(config)
 
         assert cache.enabled is True
         assert cache.ttl == 600
+        assert cache.max_size == 1024
         assert cache._cache == {}
 
     def test_init_disabled(self) -> None:
         """Test cache initialization when disabled."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = False
-        config.cache_ttl = 600
+        config = ClientConfig(cache_ttl=600, cache_max_size=1024, enable_cache=False)
 
         cache = ResponseCache(config)
 
         assert cache.enabled is False
         assert cache.ttl == 600
 
-    @pytest.mark.asyncio
-    async def test_get_cache_disabled(self) -> None:
+    def test_get_cache_disabled(self) -> None:
         """Test get returns None when cache is disabled."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = False
-        config.cache_ttl = 300
+        config = ClientConfig(cache_ttl=300, cache_max_size=1024, enable_cache=False)
 
         cache = ResponseCache(config)
 
-        result = await cache.get('test-key')
+        result = cache.get('test-key')
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_set_cache_disabled(self) -> None:
+    def test_set_cache_disabled(self) -> None:
         """Test set does nothing when cache is disabled."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = False
-        config.cache_ttl = 300
+        config = ClientConfig(cache_ttl=300, cache_max_size=1024, enable_cache=False)
 
         cache = ResponseCache(config)
 
-        await cache.set('test-key', 'test-value')
+        cache.set('test-key', 'test-value')
         # Should not store anything
         assert cache._cache == {}
 
-    @pytest.mark.asyncio
-    async def test_get_missing_key(self) -> None:
+    def test_get_missing_key(self, cache: ResponseCache) -> None:
         """Test get returns None for missing key."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
-        result = await cache.get('missing-key')
+        result = cache.get('missing-key')
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_set_and_get_success(self) -> None:
+    def test_set_and_get_success(self, cache: ResponseCache) -> None:
         """Test successful set and get operations."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
         test_value = {'data': 'test'}
-        await cache.set('test-key', test_value)
+        cache.set('test-key', test_value)
 
-        result = await cache.get('test-key')
+        result = cache.get('test-key')
         assert result == test_value
 
-    @pytest.mark.asyncio
-    async def test_get_expired_entry(self) -> None:
+    def test_get_expired_entry(self, cache: ResponseCache) -> None:
         """Test get returns None and removes expired entry."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
-        with patch('time.time', return_value=1000.0):
-            await cache.set('test-key', 'test-value')
+        with frozen_clock(1000 * NS):
+            cache.set('test-key', 'test-value')
 
         # Fast forward past expiration
-        with patch('time.time', return_value=1301.0):
-            result = await cache.get('test-key')
+        with frozen_clock(1301 * NS):
+            result = cache.get('test-key')
 
         assert result is None
         # Entry should be removed from cache
         assert 'test-key' not in cache._cache
 
-    @pytest.mark.asyncio
-    async def test_clear(self) -> None:
+    def test_clear(self, cache: ResponseCache) -> None:
         """Test clear removes all entries."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
-        await cache.set('key1', 'value1')
-        await cache.set('key2', 'value2')
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
 
         assert len(cache._cache) == 2
 
-        await cache.clear()
+        cache.clear()
 
         assert len(cache._cache) == 0
 
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_cache_disabled(self) -> None:
+    def test_cleanup_expired_cache_disabled(self) -> None:
         """Test cleanup_expired does nothing when cache disabled."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = False
-        config.cache_ttl = 300
+        config = ClientConfig(cache_ttl=300, cache_max_size=1024, enable_cache=False)
 
         cache = ResponseCache(config)
 
         # Manually add entry to test that cleanup doesn't run
         cache._cache['test-key'] = Mock()
 
-        await cache.cleanup_expired()
+        cache.cleanup_expired()
 
         # Entry should still be there since cache is disabled
         assert 'test-key' in cache._cache
 
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_removes_expired_only(self) -> None:
+    def test_cleanup_expired_removes_expired_only(self, cache: ResponseCache) -> None:
         """Test cleanup_expired removes only expired entries."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
-        with patch('time.time', return_value=1000.0):
-            await cache.set('fresh-key', 'fresh-value')
-            await cache.set('old-key', 'old-value')
+        with frozen_clock(1000 * NS):
+            cache.set('fresh-key', 'fresh-value')
+            cache.set('old-key', 'old-value')
 
         # Fast forward to make one entry expired
-        with patch('time.time', return_value=1200.0):
+        with frozen_clock(1200 * NS):
             # Manually expire one entry by modifying its expiration time
-            cache._cache['old-key'].expires_at = 1100.0
+            cache._cache['old-key'].expires_at_ns = 1100 * NS
 
-            await cache.cleanup_expired()
+            cache.cleanup_expired()
 
         # Fresh entry should remain, old entry should be removed
         assert 'fresh-key' in cache._cache
         assert 'old-key' not in cache._cache
 
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_no_expired_entries(self) -> None:
+    def test_cleanup_expired_no_expired_entries(self, cache: ResponseCache) -> None:
         """Test cleanup_expired when no entries are expired."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
-        await cache.set('key1', 'value1')
-        await cache.set('key2', 'value2')
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
 
         original_count = len(cache._cache)
 
-        await cache.cleanup_expired()
+        cache.cleanup_expired()
 
         # All entries should remain
         assert len(cache._cache) == original_count
 
-    def test_cache_key_for_search(self) -> None:
-        """Test cache key generation for search requests."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
+    def test_set_evicts_least_recently_used(self) -> None:
+        """Test set evicts the least recently used entry when full."""
+        config = ClientConfig(cache_ttl=300, cache_max_size=2, enable_cache=True)
+
+        cache = ResponseCache(config)
+
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
+        cache.set('key3', 'value3')
+
+        assert list(cache._cache) == ['key2', 'key3']
+        assert cache.get('key1') is None
+
+    def test_get_refreshes_recency(self) -> None:
+        """Test get marks an entry as recently used."""
+        config = ClientConfig(cache_ttl=300, cache_max_size=2, enable_cache=True)
 
         cache = ResponseCache(config)
 
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
+        assert cache.get('key1') == 'value1'
+
+        cache.set('key3', 'value3')
+
+        assert list(cache._cache) == ['key1', 'key3']
+
+    def test_set_existing_key_refreshes_recency(self) -> None:
+        """Test overwriting a key marks it as recently used."""
+        config = ClientConfig(cache_ttl=300, cache_max_size=2, enable_cache=True)
+
+        cache = ResponseCache(config)
+
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
+        cache.set('key1', 'updated')
+        cache.set('key3', 'value3')
+
+        assert list(cache._cache) == ['key1', 'key3']
+        assert cache.get('key1') == 'updated'
+
+    @pytest.mark.asyncio
+    async def test_set_schedules_expiry(self) -> None:
+        """Test entries set inside an event loop are removed at expiry time."""
+        config = ClientConfig(cache_ttl=0, cache_max_size=1024, enable_cache=True)
+
+        cache = ResponseCache(config)
+
+        cache.set('test-key', 'test-value')
+        assert cache._cache['test-key'].expiry_handle is not None
+
+        await asyncio.sleep(0.01)
+
+        assert 'test-key' not in cache._cache
+
+    @pytest.mark.asyncio
+    async def test_set_existing_key_cancels_prior_expiry(
+        self, cache: ResponseCache
+    ) -> None:
+        """Test overwriting a key cancels the previous entry's expiry."""
+        cache.set('test-key', 'value1')
+        first_handle = cache._cache['test-key'].expiry_handle
+        cache.set('test-key', 'value2')
+
+        assert first_handle is not None
+        assert first_handle.cancelled()
+        assert cache.get('test-key') == 'value2'
+
+    @pytest.mark.asyncio
+    async def test_eviction_and_clear_cancel_expiry(self) -> None:
+        """Test evicted and cleared entries no longer have pending expiry."""
+        config = ClientConfig(cache_ttl=300, cache_max_size=1, enable_cache=True)
+
+        cache = ResponseCache(config)
+
+        cache.set('key1', 'value1')
+        evicted_handle = cache._cache['key1'].expiry_handle
+        cache.set('key2', 'value2')
+        cleared_handle = cache._cache['key2'].expiry_handle
+        cache.clear()
+
+        assert evicted_handle is not None
+        assert evicted_handle.cancelled()
+        assert cleared_handle is not None
+        assert cleared_handle.cancelled()
+
+    def test_set_without_event_loop(self, cache: ResponseCache) -> None:
+        """Test set outside an event loop relies on read-time expiry."""
+        cache.set('test-key', 'test-value')
+
+        assert cache._cache['test-key'].expiry_handle is None
+
+    def test_cache_key_for_search(self, cache: ResponseCache) -> None:
+        """Test cache key generation for search requests."""
         # Test normal case
         key = cache.cache_key_for_search('Test-Name')
         assert key == 'search:test-name'
@@ -247,25 +292,13 @@ class TestResponseCache:
         key = cache.cache_key_for_search('  Test Name  ')
         assert key == 'search:test name'
 
-    def test_cache_key_for_server(self) -> None:
+    def test_cache_key_for_server(self, cache: ResponseCache) -> None:
         """Test cache key generation for server requests."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
         key = cache.cache_key_for_server('server-123')
         assert key == 'server:server-123'
 
-    def test_cache_key_for_server_by_name(self) -> None:
+    def test_cache_key_for_server_by_name(self, cache: ResponseCache) -> None:
         """Test cache key generation for server by name requests."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
         # Test normal case
         key = cache.cache_key_for_server_by_name('Test-Server')
         assert key == 'server_by_name:test-server'
@@ -279,17 +312,12 @@ class TestResponseCacheEdgeCases:
     """Edge case tests for ResponseCache."""
 
     @pytest.mark.asyncio
-    async def test_concurrent_access_same_key(self) -> None:
+    async def test_concurrent_access_same_key(self, cache: ResponseCache) -> None:
         """Test concurrent access to the same cache key."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
 
         # Test concurrent sets
         async def set_value(key: str, value: str) -> None:
-            await cache.set(key, value)
+            cache.set(key, value)
 
         # Run multiple sets concurrently
         await asyncio.gather(
@@ -300,102 +328,62 @@ class TestResponseCacheEdgeCases:
 
         # Should have exactly one entry
         assert len(cache._cache) == 1
-        result = await cache.get('test-key')
+        result = cache.get('test-key')
         # Result should be one of the values
         assert result in ['value1', 'value2', 'value3']
 
     @pytest.mark.asyncio
-    async def test_concurrent_get_and_cleanup(self) -> None:
+    async def test_concurrent_get_and_cleanup(self, cache: ResponseCache) -> None:
         """Test concurrent get and cleanup operations."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
+        cache.set('test-key', 'test-value')
 
-        cache = ResponseCache(config)
+        async def get_value(key: str) -> str | None:
+            return cache.get(key)
 
-        await cache.set('test-key', 'test-value')
+        async def cleanup() -> None:
+            cache.cleanup_expired()
 
         # Run get and cleanup concurrently
         results = await asyncio.gather(
-            cache.get('test-key'), cache.cleanup_expired(), return_exceptions=True
+            get_value('test-key'), cleanup(), return_exceptions=True
         )
 
         # Should not raise exceptions
         assert not any(isinstance(r, Exception) for r in results)
 
-    @pytest.mark.asyncio
-    async def test_zero_ttl(self) -> None:
-        """Test cache behavior with zero TTL."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 0
+    @pytest.mark.parametrize(
+        'ttl,elapsed_ns,expected',
+        [
+            (0, NS // 10, None),  # Expires immediately
+            (-100, 0, None),  # Expired before it was set
+            (2**31 - 1, 0, 'test-value'),  # Max 32-bit int
+        ],
+    )
+    def test_extreme_ttl(self, ttl: int, elapsed_ns: int, expected: str | None) -> None:
+        """Test cache behavior with zero, negative and very large TTLs."""
+        config = ClientConfig(cache_ttl=ttl, cache_max_size=1024, enable_cache=True)
 
         cache = ResponseCache(config)
 
-        with patch('time.time', return_value=1000.0):
-            await cache.set('test-key', 'test-value')
-
-        # Entry should be immediately expired
-        with patch('time.time', return_value=1000.1):
-            result = await cache.get('test-key')
-
-        assert result is None
+        with frozen_clock(1000 * NS):
+            cache.set('test-key', 'test-value')
 
-    @pytest.mark.asyncio
-    async def test_negative_ttl(self) -> None:
-        """Test cache behavior with negative TTL."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = -100
-
-        cache = ResponseCache(config)
+        with frozen_clock(1000 * NS + elapsed_ns):
+            result = cache.get('test-key')
 
-        with patch('time.time', return_value=1000.0):
-            await cache.set('test-key', 'test-value')
+        assert result == expected
 
-        # Entry should be immediately expired (expires_at = 900.0)
-        result = await cache.get('test-key')
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_very_large_ttl(self) -> None:
-        """Test cache behavior with very large TTL."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 2**31 - 1  # Max 32-bit int
-
-        cache = ResponseCache(config)
-
-        await cache.set('test-key', 'test-value')
-        result = await cache.get('test-key')
-
-        assert result == 'test-value'
-
-    @pytest.mark.asyncio
-    async def test_cache_none_values(self) -> None:
+    def test_cache_none_values(self, cache: ResponseCache) -> None:
         """Test caching None values."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
-        await cache.set('test-key', None)
-        result = await cache.get('test-key')
+        cache.set('test-key', None)
+        result = cache.get('test-key')
 
         assert result is None
         # Should distinguish between cached None and missing key
         assert 'test-key' in cache._cache
 
-    @pytest.mark.asyncio
-    async def test_cache_complex_objects(self) -> None:
+    def test_cache_complex_objects(self, cache: ResponseCache) -> None:
         """Test caching complex nested objects."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
         complex_value = {
             'list': [1, 2, 3],
             'dict': {'nested': {'deeply': 'value'}},
@@ -404,78 +392,57 @@ class TestResponseCacheEdgeCases:
             'bool': True,
         }
 
-        await cache.set('complex-key', complex_value)
-        result = await cache.get('complex-key')
+        cache.set('complex-key', complex_value)
+        result = cache.get('complex-key')
 
         assert result == complex_value
 
-    @pytest.mark.asyncio
-    async def test_many_entries_performance(self) -> None:
+    def test_many_entries_performance(self, cache: ResponseCache) -> None:
         """Test cache performance with many entries."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
         # Add many entries
         num_entries = 1000
         for i in range(num_entries):
-            await cache.set(f'key-{i}', f'value-{i}')
+            cache.set(f'key-{i}', f'value-{i}')
 
         assert len(cache._cache) == num_entries
 
         # Test retrieval
-        result = await cache.get('key-500')
+        result = cache.get('key-500')
         assert result == 'value-500'
 
         # Test cleanup
-        await cache.cleanup_expired()
+        cache.cleanup_expired()
         # All entries should still be there (not expired)
         assert len(cache._cache) == num_entries
 
-    @pytest.mark.asyncio
-    async def test_cleanup_with_mixed_expiration_times(self) -> None:
+    def test_cleanup_with_mixed_expiration_times(self, cache: ResponseCache) -> None:
         """Test cleanup with entries having different expiration times."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
         # Add entries at different times
-        with patch('time.time', return_value=1000.0):
-            await cache.set('old-key', 'old-value')
+        with frozen_clock(1000 * NS):
+            cache.set('old-key', 'old-value')
 
-        with patch('time.time', return_value=1100.0):
-            await cache.set('medium-key', 'medium-value')
+        with frozen_clock(1100 * NS):
+            cache.set('medium-key', 'medium-value')
 
-        with patch('time.time', return_value=1200.0):
-            await cache.set('new-key', 'new-value')
+        with frozen_clock(1200 * NS):
+            cache.set('new-key', 'new-value')
 
         # Cleanup at time when only old entry is expired
-        with patch('time.time', return_value=1301.0):  # old-key expires at 1300
-            await cache.cleanup_expired()
+        with frozen_clock(1301 * NS):  # old-key expires at 1300
+            cache.cleanup_expired()
 
         assert 'old-key' not in cache._cache
         assert 'medium-key' in cache._cache
         assert 'new-key' in cache._cache
 
-    @pytest.mark.asyncio
-    async def test_empty_cache_operations(self) -> None:
+    def test_empty_cache_operations(self, cache: ResponseCache) -> None:
         """Test operations on empty cache."""
-        config = Mock(spec=ClientConfig)
-        config.enable_cache = True
-        config.cache_ttl = 300
-
-        cache = ResponseCache(config)
-
         # All operations on empty cache should work
-        result = await cache.get('any-key')
+        result = cache.get('any-key')
         assert result is None
 
-        await cache.cleanup_expired()  # Should not raise
+        cache.cleanup_expired()  # Should not raise
 
-        await cache.clear()  # Should not raise
+        cache.clear()  # Should not raise
 
         assert len(cache._cache) == 0
@@ -1,16 +1,24 @@
 """Tests for the CLI module."""
 
 import json
+import weakref
+from collections.abc import Iterator
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from mcp_registry_client import constants
 from mcp_registry_client.cli import (
     async_main,
+    create_parser,
+    event_loop_factory,
+    load_command,
     main,
 )
 from mcp_registry_client.client import RegistryAPIError, RegistryClientError
+from mcp_registry_client.commands import InfoCommand, SearchCommand
 from mcp_registry_client.error_handling import handle_command_error
 from mcp_registry_client.formatters import (
     format_env_variables,
@@ -54,6 +62,21 @@ def sample_server():
     )
 
 
+@pytest.fixture
+def unloaded_config_defaults(monkeypatch) -> Iterator[None]:
+    """Make the next client configuration read the config file again."""
+    # Only drop defaults already resolved, as looking up others would resolve them
+    for name in constants._CLIENT_DEFAULTS.keys() & vars(constants).keys():
+        monkeypatch.delattr(constants, name)
+    constants._load_client_config.cache_clear()
+    # A shared client left by an earlier test already holds its configuration
+    monkeypatch.setattr(
+        'mcp_registry_client.client._shared_clients', weakref.WeakKeyDictionary()
+    )
+    yield
+    constants._load_client_config.cache_clear()
+
+
 class TestFormatting:
     """Tests for formatting functions."""
 
@@ -136,6 +159,23 @@ class TestFormatting:
         parsed = json.loads(captured.out)
         assert parsed == data
 
+    def test_print_json_escapes_non_ascii(self, capsys) -> None:
+        """Test JSON printing escapes non-ASCII text, whatever the stdout encoding."""
+        data = {'test': 'café ☕', 'nested': {'items': [1, 2]}}
+        print_json(data)
+
+        captured = capsys.readouterr()
+        assert captured.out == json.dumps(data, indent=2) + '\n'
+        assert captured.out.isascii()
+
+    def test_print_json_custom_indent(self, capsys) -> None:
+        """Test JSON printing honours indents other than 2."""
+        data = {'test': {'nested': True}}
+        print_json(data, indent=4)
+
+        captured = capsys.readouterr()
+        assert captured.out == json.dumps(data, indent=4) + '\n'
+
     def test_print_table_empty(self, capsys) -> None:
         """Test table printing with empty list."""
         print_table([])
@@ -157,6 +197,17 @@ class TestFormatting:
         assert '1.0.0' in output
         assert 'A test server for testing purposes' in output
 
+    def test_print_table_truncates_long_descriptions(self, sample_server, capsys) -> None:
+        """Test table printing truncates descriptions wider than the column."""
+        print_table([sample_server], max_description_width=15)
+
+        captured = capsys.readouterr()
+        lines = captured.out.splitlines()
+
+        assert 'A test serve...' in lines[2]
+        assert 'A test server for' not in captured.out
+        assert len(lines[0]) == len(lines[2])
+
     def test_format_env_variables_empty(self) -> None:
         """Test environment variables formatting with empty list."""
         package = Package(
@@ -285,6 +336,16 @@ class TestFormatting:
         assert result == 1
         assert 'Error: Unexpected error occurred (test operation)' in captured.err
 
+    def test_handle_command_error_file_not_found(self, capsys) -> None:
+        """Test error handling for missing files reports the error itself."""
+        exc = FileNotFoundError('Config file is missing')
+
+        result = handle_command_error(exc, 'test operation')
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert captured.err == 'Error: Config file is missing\n'
+
     def test_handle_command_error_api_error_server_unavailable(self, capsys) -> None:
         """Test error handling for server unavailable (HTTP 500+)."""
         exc = RegistryAPIError('Internal server error')
@@ -298,6 +359,16 @@ class TestFormatting:
             'Error: Registry service unavailable. Please try again later.' in captured.err
         )
 
+    def test_handle_command_error_api_error_other_status(self, capsys) -> None:
+        """Test error handling for API errors with other HTTP statuses."""
+        exc = RegistryAPIError('Bad request', status_code=400)
+
+        result = handle_command_error(exc, 'test operation')
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert 'Error: API request failed (HTTP 400)' in captured.err
+
     def test_handle_command_error_api_error_no_status_code(self, capsys) -> None:
         """Test error handling for API error without status code."""
         exc = RegistryAPIError('Network error')
@@ -320,13 +391,11 @@ class TestCLI:
         mock_result.servers = [sample_server]
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.search_servers.return_value = mock_result
 
         with (
             patch(
-                'mcp_registry_client.commands.search.RegistryClient',
+                'mcp_registry_client.commands.search.get_client',
                 return_value=mock_client,
             ),
             patch('sys.argv', ['mcp-registry', 'search', 'test']),
@@ -343,13 +412,11 @@ class TestCLI:
         mock_result.servers = [sample_server]
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.search_servers.return_value = mock_result
 
         with (
             patch(
-                'mcp_registry_client.commands.search.RegistryClient',
+                'mcp_registry_client.commands.search.get_client',
                 return_value=mock_client,
             ),
             patch('sys.argv', ['mcp-registry', 'search', 'test']),
@@ -366,13 +433,11 @@ class TestCLI:
         mock_result.servers = [sample_server]
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.search_servers.return_value = mock_result
 
         with (
             patch(
-                'mcp_registry_client.commands.search.RegistryClient',
+                'mcp_registry_client.commands.search.get_client',
                 return_value=mock_client,
             ),
             patch('sys.argv', ['mcp-registry', '--json', 'search', 'test']),
@@ -390,14 +455,10 @@ class TestCLI:
     async def test_info_command_success(self, sample_server) -> None:
         """Test successful info command."""
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.get_server_by_name.return_value = sample_server
 
         with (
-            patch(
-                'mcp_registry_client.commands.info.RegistryClient', return_value=mock_client
-            ),
+            patch('mcp_registry_client.commands.info.get_client', return_value=mock_client),
             patch('sys.argv', ['mcp-registry', 'info', 'test-server']),
         ):
             result = await async_main()
@@ -409,14 +470,10 @@ class TestCLI:
     async def test_info_command_not_found(self) -> None:
         """Test info command when server not found."""
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.get_server_by_name.return_value = None
 
         with (
-            patch(
-                'mcp_registry_client.commands.info.RegistryClient', return_value=mock_client
-            ),
+            patch('mcp_registry_client.commands.info.get_client', return_value=mock_client),
             patch('sys.argv', ['mcp-registry', 'info', 'nonexistent']),
         ):
             result = await async_main()
@@ -427,14 +484,10 @@ class TestCLI:
     async def test_info_command_json_output(self, sample_server, capsys) -> None:
         """Test info command with JSON output."""
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.get_server_by_name.return_value = sample_server
 
         with (
-            patch(
-                'mcp_registry_client.commands.info.RegistryClient', return_value=mock_client
-            ),
+            patch('mcp_registry_client.commands.info.get_client', return_value=mock_client),
             patch('sys.argv', ['mcp-registry', '--json', 'info', 'test-server']),
         ):
             result = await async_main()
@@ -446,6 +499,44 @@ class TestCLI:
         assert output_data['name'] == 'test-server'
         assert output_data['repository']['url'] == 'https://github.com/test/repo'
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('unloaded_config_defaults')
+    async def test_missing_config_file(
+        self, tmp_path: Path, monkeypatch, capsys, caplog
+    ) -> None:
+        """Test a MCP_CONFIG_TOML path that is not a file is reported in one line."""
+        config_file = tmp_path / 'missing.toml'
+        monkeypatch.setenv('MCP_CONFIG_TOML', str(config_file))
+
+        with patch('sys.argv', ['mcp-registry', 'search', 'test']):
+            result = await async_main()
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert captured.err == (
+            f'Error: MCP_CONFIG_TOML is set to {str(config_file)!r}, which is not a file\n'
+        )
+        # Reported as a user error, without logging a traceback
+        assert all(record.exc_info is None for record in caplog.records)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('unloaded_config_defaults')
+    async def test_invalid_config_file(self, tmp_path: Path, monkeypatch, capsys) -> None:
+        """Test a config file that is not valid TOML is reported in one line."""
+        config_file = tmp_path / 'config.toml'
+        config_file.write_text('[client]\ntimeout =\n')
+        monkeypatch.setenv('MCP_CONFIG_TOML', str(config_file))
+
+        with patch('sys.argv', ['mcp-registry', 'info', 'test-server']):
+            result = await async_main()
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert captured.err.startswith(
+            f'Error: Config file {str(config_file)!r} is not valid TOML: '
+        )
+        assert captured.err.count('\n') == 1
+
     @pytest.mark.asyncio
     async def test_invalid_command(self) -> None:
         """Test handling of invalid command."""
@@ -456,6 +547,25 @@ class TestCLI:
         # argparse raises SystemExit for invalid commands
         assert exc_info.value.code == 2
 
+    @pytest.mark.asyncio
+    async def test_unregistered_command_skips_logging_setup(self) -> None:
+        """Test logging is left untouched when no command class is registered."""
+        with (
+            patch.dict('mcp_registry_client.cli.COMMAND_REGISTRY', {}, clear=True),
+            patch('mcp_registry_client.cli.setup_logging') as mock_setup_logging,
+            patch('sys.argv', ['mcp-registry', 'search', 'test']),
+        ):
+            result = await async_main()
+
+        mock_setup_logging.assert_not_called()
+        assert result == 1
+
+    def test_load_command(self) -> None:
+        """Test command classes are resolved from the registry."""
+        assert load_command('search') is SearchCommand
+        assert load_command('info') is InfoCommand
+        assert load_command('unknown') is None
+
     def test_main_entry_point_success(self) -> None:
         """Test main entry point success."""
         with patch('mcp_registry_client.cli.asyncio.run', return_value=0) as mock_run:
@@ -464,9 +574,60 @@ class TestCLI:
         mock_run.assert_called_once()
         assert result == 0
 
+    def test_event_loop_factory_without_uvloop(self) -> None:
+        """Test the default event loop is used when uvloop is not installed."""
+        with patch.dict('sys.modules', {'uvloop': None}):
+            assert event_loop_factory() is None
+
+    def test_event_loop_factory_with_uvloop(self) -> None:
+        """Test uvloop's loop factory is used when uvloop is installed."""
+        mock_uvloop = Mock()
+
+        with patch.dict('sys.modules', {'uvloop': mock_uvloop}):
+            assert event_loop_factory() is mock_uvloop.new_event_loop
+
     def test_main_entry_point_keyboard_interrupt(self) -> None:
         """Test main entry point KeyboardInterrupt handling."""
         with patch('mcp_registry_client.cli.asyncio.run', side_effect=KeyboardInterrupt):
             result = main()
 
         assert result == 130
+
+
+class TestArgumentParser:
+    """Test the CLI argument parser in-process."""
+
+    @pytest.mark.parametrize(
+        'args,expected',
+        [
+            (['--help'], 'Search and retrieve MCP servers'),
+            (['search', '--help'], 'Search term to find servers'),
+            (['info', '--help'], 'Name of the server to get information about'),
+        ],
+    )
+    def test_help(self, args: list[str], expected: str, capsys) -> None:
+        """Test help output for the program and each command."""
+        with pytest.raises(SystemExit) as exc_info:
+            create_parser().parse_args(args)
+
+        assert exc_info.value.code == 0
+        output = capsys.readouterr().out
+        assert 'mcp-registry' in output
+        assert expected in output
+
+    def test_invalid_command(self, capsys) -> None:
+        """Test an unknown command is rejected."""
+        with pytest.raises(SystemExit) as exc_info:
+            create_parser().parse_args(['invalid-command'])
+
+        assert exc_info.value.code == 2
+        assert 'invalid choice' in capsys.readouterr().err
+
+    @pytest.mark.parametrize('command', ['search', 'info'])
+    def test_missing_required_arguments(self, command: str, capsys) -> None:
+        """Test commands require their positional argument."""
+        with pytest.raises(SystemExit) as exc_info:
+            create_parser().parse_args([command])
+
+        assert exc_info.value.code == 2
+        assert 'required' in capsys.readouterr().err
@@ -1,12 +1,26 @@
 """Tests for the registry client."""
 
+import asyncio
+import json
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
-from mcp_registry_client.client import RegistryAPIError, RegistryClient, RegistryClientError
+from mcp_registry_client.client import (
+    RegistryAPIError,
+    RegistryClient,
+    RegistryClientError,
+    close_shared_client,
+    get_client,
+)
+from mcp_registry_client.config import ClientConfig
+
+
+def json_bytes(data: object) -> bytes:
+    """Encode test data as a JSON response body."""
+    return json.dumps(data, default=str).encode()
 
 
 @pytest.fixture
@@ -55,6 +69,39 @@ class TestRegistryClient:
         assert client.base_url == 'https://custom.registry.com'
         assert client.timeout == 60.0
 
+    @pytest.mark.asyncio
+    async def test_connection_pool_limits(self) -> None:
+        """Test the HTTP client is created with the configured pool limits."""
+        config = ClientConfig(
+            pool_max_connections=10,
+            pool_max_keepalive=5,
+            pool_keepalive_expiry=15.0,
+        )
+
+        with patch('mcp_registry_client.client.httpx.AsyncClient') as mock_async_client:
+            client = RegistryClient(config=config)
+            await client._ensure_client()
+
+        limits = mock_async_client.call_args.kwargs['limits']
+        assert limits.max_connections == 10
+        assert limits.max_keepalive_connections == 5
+        assert limits.keepalive_expiry == 15.0
+
+    @pytest.mark.asyncio
+    async def test_event_hooks(self) -> None:
+        """Test event hooks are passed on to the HTTP client."""
+
+        async def on_request(_request: httpx.Request) -> None:
+            pass
+
+        event_hooks = {'request': [on_request]}
+
+        with patch('mcp_registry_client.client.httpx.AsyncClient') as mock_async_client:
+            client = RegistryClient(event_hooks=event_hooks)
+            await client._ensure_client()
+
+        assert mock_async_client.call_args.kwargs['event_hooks'] == event_hooks
+
     @pytest.mark.asyncio
     async def test_context_manager(self) -> None:
         """Test client as async context manager."""
@@ -67,7 +114,7 @@ class TestRegistryClient:
     async def test_search_servers_success(self, sample_search_response) -> None:
         """Test successful server search."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_search_response
+        mock_response.content = json_bytes(sample_search_response)
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -90,7 +137,7 @@ class TestRegistryClient:
     async def test_search_servers_with_name(self, sample_search_response) -> None:
         """Test server search with name filter."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_search_response
+        mock_response.content = json_bytes(sample_search_response)
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -124,8 +171,8 @@ class TestRegistryClient:
         """Test server search with HTTP error."""
         mock_response = Mock()
         mock_response.status_code = 404
-        mock_response.text = 'Not Found'
-        mock_response.json.return_value = {'error': 'Not found'}
+        mock_response.headers = {'content-type': 'application/json'}
+        mock_response.content = json_bytes({'error': 'Not found'})
 
         http_error = httpx.HTTPStatusError(
             'Not Found',
@@ -143,6 +190,7 @@ class TestRegistryClient:
             await client.search_servers('test')
 
         assert exc_info.value.status_code == 404
+        assert str(exc_info.value) == 'Not found'
 
     @pytest.mark.asyncio
     async def test_search_servers_request_error(self) -> None:
@@ -164,7 +212,7 @@ class TestRegistryClient:
     async def test_search_servers_invalid_response(self) -> None:
         """Test server search with invalid response."""
         mock_response = Mock()
-        mock_response.json.return_value = {'invalid': 'data'}
+        mock_response.content = json_bytes({'invalid': 'data'})
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -180,7 +228,7 @@ class TestRegistryClient:
     async def test_get_server_by_id_success(self, sample_server_data) -> None:
         """Test successful get server by ID."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_server_data
+        mock_response.content = json_bytes(sample_server_data)
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -205,11 +253,11 @@ class TestRegistryClient:
     ) -> None:
         """Test get server by name when found."""
         search_response = Mock()
-        search_response.json.return_value = sample_search_response
+        search_response.content = json_bytes(sample_search_response)
         search_response.raise_for_status.return_value = None
 
         server_response = Mock()
-        server_response.json.return_value = sample_server_data
+        server_response.content = json_bytes(sample_server_data)
         server_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -223,11 +271,95 @@ class TestRegistryClient:
         assert result is not None
         assert result.name == 'test-server'
 
+    @pytest.mark.asyncio
+    async def test_get_server_by_name_fetches_details_for_search_record(
+        self, sample_server_data
+    ) -> None:
+        """Test a search record with packages is not taken for the full details."""
+        package = {'registry_type': 'npm', 'identifier': 'test-package', 'version': '1.0.0'}
+        search_data = {**sample_server_data, 'packages': [package]}
+        search_response = Mock()
+        search_response.content = json_bytes({'servers': [search_data]})
+        search_response.raise_for_status.return_value = None
+
+        # Only the detail endpoint includes the package's environment variables
+        env_var = {'name': 'API_KEY', 'description': 'API key', 'is_required': True}
+        detail_data = {
+            **sample_server_data,
+            'packages': [{**package, 'environment_variables': [env_var]}],
+        }
+        server_response = Mock()
+        server_response.content = json_bytes(detail_data)
+        server_response.raise_for_status.return_value = None
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = [search_response, server_response]
+
+        client = RegistryClient()
+        client._client = mock_client
+
+        result = await client.get_server_by_name('test-server')
+
+        assert mock_client.request.call_count == 2
+        mock_client.request.assert_called_with('GET', '/v0/servers/test-id')
+        assert result is not None
+        assert result.packages is not None
+        assert result.packages[0].environment_variables is not None
+        assert result.packages[0].environment_variables[0].name == 'API_KEY'
+
+    @pytest.mark.asyncio
+    async def test_get_server_by_name_without_id(self, sample_server_data) -> None:
+        """Test get server by name returns None when the match has no ID."""
+        sample_server_data['_meta']['io.modelcontextprotocol.registry/official']['id'] = ''
+        search_response = Mock()
+        search_response.content = json_bytes({'servers': [sample_server_data]})
+        search_response.raise_for_status.return_value = None
+
+        mock_client = AsyncMock()
+        mock_client.request.return_value = search_response
+
+        client = RegistryClient()
+        client._client = mock_client
+
+        result = await client.get_server_by_name('test-server')
+
+        # Only the search is sent, never a request for /v0/servers/
+        mock_client.request.assert_called_once_with(
+            'GET',
+            '/v0/servers',
+            params={'search': 'test-server'},
+        )
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_search_servers_does_not_cache_servers_by_id(
+        self, sample_search_response, sample_server_data
+    ) -> None:
+        """Test search records are not cached as the full server details."""
+        search_response = Mock()
+        search_response.content = json_bytes(sample_search_response)
+        search_response.raise_for_status.return_value = None
+
+        server_response = Mock()
+        server_response.content = json_bytes(sample_server_data)
+        server_response.raise_for_status.return_value = None
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = [search_response, server_response]
+
+        client = RegistryClient()
+        client._client = mock_client
+
+        await client.search_servers('test')
+        await client.get_server_by_id('test-id')
+
+        assert mock_client.request.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_server_by_name_not_found(self) -> None:
         """Test get server by name when not found."""
         mock_response = Mock()
-        mock_response.json.return_value = {'servers': []}
+        mock_response.content = json_bytes({'servers': []})
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -261,11 +393,11 @@ class TestRegistryClient:
         }
 
         search_response = Mock()
-        search_response.json.return_value = {'servers': [server_data]}
+        search_response.content = json_bytes({'servers': [server_data]})
         search_response.raise_for_status.return_value = None
 
         server_response = Mock()
-        server_response.json.return_value = server_data
+        server_response.content = json_bytes(server_data)
         server_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -342,7 +474,7 @@ class TestRegistryClient:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = search_data
+        mock_response.content = json_bytes(search_data)
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -379,7 +511,7 @@ class TestRegistryClient:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = server_data
+        mock_response.content = json_bytes(server_data)
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -412,7 +544,7 @@ class TestRegistryClient:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = server_data
+        mock_response.content = json_bytes(server_data)
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -473,7 +605,7 @@ class TestRegistryClientEdgeCases:
     async def test_search_servers_json_decode_error(self) -> None:
         """Test search servers with invalid JSON response."""
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError('Invalid JSON')
+        mock_response.content = b'not json'
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -489,7 +621,7 @@ class TestRegistryClientEdgeCases:
     async def test_get_server_by_id_json_decode_error(self) -> None:
         """Test get server by ID with invalid JSON response."""
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError('Invalid JSON')
+        mock_response.content = b'not json'
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -498,9 +630,7 @@ class TestRegistryClientEdgeCases:
         client = RegistryClient()
         client._client = mock_client
 
-        # The JSON decode error occurs on line 246 which is outside the try block
-        # So it raises ValueError directly, not RegistryClientError
-        with pytest.raises(ValueError, match='Invalid JSON'):
+        with pytest.raises(RegistryClientError, match='Failed to parse response'):
             await client.get_server_by_id('test-id')
 
     @pytest.mark.asyncio
@@ -508,8 +638,8 @@ class TestRegistryClientEdgeCases:
         """Test HTTP error handling when response body is not JSON."""
         mock_response = Mock()
         mock_response.status_code = 500
-        mock_response.text = 'Internal Server Error'
-        mock_response.json.side_effect = ValueError('Not JSON')
+        mock_response.headers = {'content-type': 'text/plain'}
+        mock_response.content = b'Internal Server Error'
 
         http_error = httpx.HTTPStatusError(
             'Internal Server Error',
@@ -534,8 +664,8 @@ class TestRegistryClientEdgeCases:
         """Test HTTP error handling with malformed error response."""
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.text = 'Bad Request'
-        mock_response.json.return_value = {'invalid_field': 'not an error object'}
+        mock_response.headers = {'content-type': 'application/json'}
+        mock_response.content = json_bytes({'invalid_field': 'not an error object'})
 
         http_error = httpx.HTTPStatusError(
             'Bad Request',
@@ -553,7 +683,32 @@ class TestRegistryClientEdgeCases:
             await client.search_servers('test')
 
         assert exc_info.value.status_code == 400
-        assert 'HTTP 400: Bad Request' in str(exc_info.value)
+        assert 'HTTP 400: {"invalid_field"' in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_http_error_truncates_long_body(self) -> None:
+        """Test HTTP error messages include only a bounded excerpt of the body."""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_response.headers = {'content-type': 'text/html'}
+        mock_response.content = b'x' * 2000
+
+        http_error = httpx.HTTPStatusError(
+            'Forbidden',
+            request=Mock(),
+            response=mock_response,
+        )
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = http_error
+
+        client = RegistryClient()
+        client._client = mock_client
+
+        with pytest.raises(RegistryAPIError) as exc_info:
+            await client.search_servers('test')
+
+        assert str(exc_info.value) == 'HTTP 403: ' + 'x' * 512
 
     @pytest.mark.asyncio
     async def test_get_server_by_name_exact_match_priority(self) -> None:
@@ -595,11 +750,11 @@ class TestRegistryClientEdgeCases:
         }
 
         search_response = Mock()
-        search_response.json.return_value = {'servers': [partial_server, exact_server]}
+        search_response.content = json_bytes({'servers': [partial_server, exact_server]})
         search_response.raise_for_status.return_value = None
 
         server_response = Mock()
-        server_response.json.return_value = exact_server
+        server_response.content = json_bytes(exact_server)
         server_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -635,11 +790,11 @@ class TestRegistryClientEdgeCases:
         }
 
         search_response = Mock()
-        search_response.json.return_value = {'servers': [server_data]}
+        search_response.content = json_bytes({'servers': [server_data]})
         search_response.raise_for_status.return_value = None
 
         server_response = Mock()
-        server_response.json.return_value = server_data
+        server_response.content = json_bytes(server_data)
         server_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -677,7 +832,7 @@ class TestRegistryClientEdgeCases:
     async def test_search_servers_name_strip_whitespace(self) -> None:
         """Test that search servers strips whitespace from name parameter."""
         mock_response = Mock()
-        mock_response.json.return_value = {'servers': []}
+        mock_response.content = json_bytes({'servers': []})
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
@@ -693,3 +848,153 @@ class TestRegistryClientEdgeCases:
             '/v0/servers',
             params={'search': 'test-name'},
         )
+
+
+class TestRequestCoalescing:
+    """Tests for single-flight coalescing of concurrent requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_one_request(
+        self, sample_search_response
+    ) -> None:
+        """Test concurrent identical searches issue a single request."""
+        mock_response = Mock()
+        mock_response.content = json_bytes(sample_search_response)
+        mock_response.raise_for_status.return_value = None
+
+        async def slow_request(*_args: object, **_kwargs: object) -> Mock:
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = slow_request
+
+        client = RegistryClient()
+        client._client = mock_client
+
+        results = await asyncio.gather(*(client.search_servers('test') for _ in range(5)))
+
+        assert mock_client.request.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_server_by_id_share_one_request(
+        self, sample_server_data
+    ) -> None:
+        """Test concurrent identical server lookups issue a single request."""
+        mock_response = Mock()
+        mock_response.content = json_bytes(sample_server_data)
+        mock_response.raise_for_status.return_value = None
+
+        async def slow_request(*_args: object, **_kwargs: object) -> Mock:
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = slow_request
+
+        client = RegistryClient()
+        client._client = mock_client
+
+        results = await asyncio.gather(
+            client.get_server_by_id('test-id'), client.get_server_by_id('test-id')
+        )
+
+        assert mock_client.request.call_count == 1
+        assert results[0] is results[1]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_error(self) -> None:
+        """Test a failed shared request raises in every waiting caller."""
+
+        async def failing_request(*_args: object, **_kwargs: object) -> Mock:
+            await asyncio.sleep(0.01)
+            msg = 'Connection failed'
+            raise httpx.RequestError(msg)
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = failing_request
+
+        client = RegistryClient()
+        client.config.max_retries = 0
+        client._retry_strategy.max_retries = 0
+        client._client = mock_client
+
+        results = await asyncio.gather(
+            client.search_servers('test'),
+            client.search_servers('test'),
+            return_exceptions=True,
+        )
+
+        assert mock_client.request.call_count == 1
+        assert all(isinstance(result, RegistryAPIError) for result in results)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(
+        self, sample_search_response
+    ) -> None:
+        """Test a caller joining a request still gets a result if the first is cancelled."""
+        mock_response = Mock()
+        mock_response.content = json_bytes(sample_search_response)
+        mock_response.raise_for_status.return_value = None
+
+        async def slow_request(*_args: object, **_kwargs: object) -> Mock:
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = slow_request
+
+        client = RegistryClient()
+        client._client = mock_client
+
+        leader = asyncio.create_task(client.search_servers('test'))
+        await asyncio.sleep(0)  # Let the leader start its request
+        follower = asyncio.create_task(client.search_servers('test'))
+        await asyncio.sleep(0)  # Let the follower join it
+        leader.cancel()
+
+        result = await follower
+
+        assert leader.cancelled()
+        assert len(result.servers) == 1
+        # The follower had to send its own request after the leader's was cancelled
+        assert mock_client.request.call_count == 2
+        assert client._inflight == {}
+
+
+class TestSharedClient:
+    """Tests for the shared per-loop registry client."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_instance(self) -> None:
+        """Test get_client returns the same client within one event loop."""
+        first = await get_client()
+        second = await get_client()
+
+        try:
+            assert first is second
+            assert first._client is not None
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_close_shared_client(self) -> None:
+        """Test close_shared_client closes and forgets the shared client."""
+        first = await get_client()
+        await close_shared_client()
+
+        assert first._client is None
+
+        second = await get_client()
+        try:
+            assert second is not first
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_close_shared_client_without_client(self) -> None:
+        """Test close_shared_client when no client was created."""
+        await close_shared_client()  # Should not raise
@@ -49,6 +49,15 @@ class TestSearchCommand:
         # Should not raise any exception
         command.validate_args()
 
+    def test_validate_args_strips_name(self) -> None:
+        """Test validation stores the stripped search term."""
+        args = argparse.Namespace(name='  test-query  ', json=False)
+        command = SearchCommand(args)
+
+        command.validate_args()
+
+        assert command.args.name == 'test-query'
+
     def test_validate_args_empty_name(self) -> None:
         """Test validation failure with empty name."""
         args = argparse.Namespace(name='', json=False)
@@ -75,12 +84,10 @@ class TestSearchCommand:
         mock_result.servers = [sample_server]
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.search_servers.return_value = mock_result
 
         with patch(
-            'mcp_registry_client.commands.search.RegistryClient', return_value=mock_client
+            'mcp_registry_client.commands.search.get_client', return_value=mock_client
         ):
             result = await command.execute()
 
@@ -126,12 +133,10 @@ class TestSearchCommand:
         mock_result.servers = [sample_server]
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.search_servers.return_value = mock_result
 
         with patch(
-            'mcp_registry_client.commands.search.RegistryClient', return_value=mock_client
+            'mcp_registry_client.commands.search.get_client', return_value=mock_client
         ):
             result = await command.run()
 
@@ -153,12 +158,10 @@ class TestSearchCommand:
         command = SearchCommand(args)
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.search_servers.side_effect = RegistryAPIError('API failed')
 
         with patch(
-            'mcp_registry_client.commands.search.RegistryClient', return_value=mock_client
+            'mcp_registry_client.commands.search.get_client', return_value=mock_client
         ):
             result = await command.run()
 
@@ -191,12 +194,10 @@ class TestInfoCommand:
         command = InfoCommand(args)
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.get_server_by_name.return_value = sample_server
 
         with patch(
-            'mcp_registry_client.commands.info.RegistryClient', return_value=mock_client
+            'mcp_registry_client.commands.info.get_client', return_value=mock_client
         ):
             result = await command.execute()
 
@@ -210,12 +211,10 @@ class TestInfoCommand:
         command = InfoCommand(args)
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.get_server_by_name.return_value = None
 
         with patch(
-            'mcp_registry_client.commands.info.RegistryClient', return_value=mock_client
+            'mcp_registry_client.commands.info.get_client', return_value=mock_client
         ):
             with pytest.raises(ValueError, match='Server "nonexistent" not found'):
                 await command.execute()
@@ -248,12 +247,10 @@ class TestInfoCommand:
         command = InfoCommand(args)
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.get_server_by_name.return_value = sample_server
 
         with patch(
-            'mcp_registry_client.commands.info.RegistryClient', return_value=mock_client
+            'mcp_registry_client.commands.info.get_client', return_value=mock_client
         ):
             result = await command.run()
 
@@ -266,12 +263,10 @@ class TestInfoCommand:
         command = InfoCommand(args)
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
         mock_client.get_server_by_name.return_value = None
 
         with patch(
-            'mcp_registry_client.commands.info.RegistryClient', return_value=mock_client
+            'mcp_registry_client.commands.info.get_client', return_value=mock_client
         ):
             result = await command.run()
 
@@ -0,0 +1,46 @@
+"""Tests for configuration defaults."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mcp_registry_client.constants import _load_client_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_load() -> Iterator[None]:
+    """Read the config file afresh in each test, and again after it."""
+    _load_client_config.cache_clear()
+    yield
+    _load_client_config.cache_clear()
+
+
+class TestLoadClientConfig:
+    """Tests for loading the client section of the TOML config file."""
+
+    def test_config_file_from_environment(self, tmp_path: Path, monkeypatch) -> None:
+        """Test MCP_CONFIG_TOML selects the config file to read."""
+        config_file = tmp_path / 'config.toml'
+        config_file.write_text('[client]\ntimeout = 12.5\n')
+        monkeypatch.setenv('MCP_CONFIG_TOML', str(config_file))
+
+        assert _load_client_config() == {'timeout': 12.5}
+
+    def test_missing_config_file_from_environment(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test a MCP_CONFIG_TOML path that is not a file is an error."""
+        monkeypatch.setenv('MCP_CONFIG_TOML', str(tmp_path / 'missing.toml'))
+
+        with pytest.raises(FileNotFoundError, match='MCP_CONFIG_TOML'):
+            _load_client_config()
+
+    def test_invalid_config_file(self, tmp_path: Path, monkeypatch) -> None:
+        """Test a config file that is not valid TOML is an error naming the file."""
+        config_file = tmp_path / 'config.toml'
+        config_file.write_text('[client\n')
+        monkeypatch.setenv('MCP_CONFIG_TOML', str(config_file))
+
+        with pytest.raises(ValueError, match='is not valid TOML'):
+            _load_client_config()
@@ -242,3 +242,45 @@ class TestSearchResponse:
         assert len(response.servers) == 2
         assert response.servers[0].name == 'test-server-1'
         assert response.servers[1].name == 'test-server-2'
+
+    def test_find_server_exact_match_priority(self) -> None:
+        """Test find_server prefers an exact name over an earlier partial match."""
+        now = datetime.now()
+        meta = {
+            'io.modelcontextprotocol.registry/official': {
+                'id': 'test-id',
+                'published_at': now,
+                'updated_at': now,
+                'is_latest': True,
+            },
+        }
+        data = {
+            'servers': [
+                {
+                    'name': name,
+                    'description': 'Test server',
+                    'repository': {
+                        'url': 'https://github.com/test/repo',
+                        'source': 'github',
+                    },
+                    'version': '1.0.0',
+                    '_meta': meta,
+                }
+                for name in ('Test-Server-Extended', 'test-server')
+            ],
+        }
+        response = SearchResponse.model_validate(data)
+
+        exact = response.find_server('test-server')
+        assert exact is response.servers[1]
+
+        partial = response.find_server('extended')
+        assert partial is response.servers[0]
+
+        assert response.find_server('missing') is None
+
+        # Lookups follow the current server list, not the one first searched
+        response.servers = [response.servers[0]]
+        assert response.find_server('test-server') is response.servers[0]
+        copied = response.model_copy(update={'servers': []})
+        assert copied.find_server('test-server') is None
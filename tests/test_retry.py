@@ -0,0 +1,58 @@
+"""Tests for retry logic."""
+
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from mcp_registry_client.config import ClientConfig
+from mcp_registry_client.retry import RetryStrategy
+
+
+def status_error(status_code: int) -> httpx.HTTPStatusError:
+    """Create an HTTP status error with the given status code."""
+    return httpx.HTTPStatusError(
+        'error', request=Mock(), response=Mock(status_code=status_code)
+    )
+
+
+class TestRetryStrategy:
+    """Tests for RetryStrategy."""
+
+    @pytest.fixture
+    def strategy(self) -> RetryStrategy:
+        """Create a retry strategy with a known schedule."""
+        return RetryStrategy(
+            ClientConfig(max_retries=3, retry_delay=0.5, backoff_factor=2.0)
+        )
+
+    @pytest.mark.parametrize('status_code', [429, 500, 502, 503, 504])
+    def test_should_retry_transient_status(
+        self, strategy: RetryStrategy, status_code: int
+    ) -> None:
+        """Test transient HTTP statuses are retried."""
+        assert strategy.should_retry(0, status_error(status_code))
+
+    @pytest.mark.parametrize('status_code', [400, 404, 501, 505])
+    def test_should_not_retry_permanent_status(
+        self, strategy: RetryStrategy, status_code: int
+    ) -> None:
+        """Test permanent HTTP statuses are not retried."""
+        assert not strategy.should_retry(0, status_error(status_code))
+
+    def test_should_retry_request_error(self, strategy: RetryStrategy) -> None:
+        """Test network errors are retried until retries run out."""
+        exc = httpx.ConnectError('Connection failed')
+
+        assert strategy.should_retry(2, exc)
+        assert not strategy.should_retry(3, exc)
+
+    def test_get_delay(self, strategy: RetryStrategy) -> None:
+        """Test exponential backoff delays, including beyond the schedule."""
+        assert [strategy.get_delay(attempt) for attempt in range(5)] == [
+            0.5,
+            1.0,
+            2.0,
+            4.0,
+            8.0,
+        ]
@@ -18,6 +18,13 @@ class TestValidationHelpers:
         validate_non_empty_string('valid-string', 'test field')
         validate_non_empty_string('   valid-string   ', 'test field')  # with whitespace
 
+    def test_validate_non_empty_string_returns_stripped(self) -> None:
+        """Test validation returns the value without surrounding whitespace."""
+        assert validate_non_empty_string('valid', 'test field') == 'valid'
+        assert (
+            validate_non_empty_string('  valid string \n', 'test field') == 'valid string'
+        )
+
     def test_validate_non_empty_string_empty(self) -> None:
         """Test validation failure with empty string."""
         with pytest.raises(ValueError, match='test field cannot be empty'):
@@ -35,6 +42,10 @@ class TestValidationHelpers:
         validate_search_term('valid-search-term')
         validate_search_term('   valid-term   ')  # with whitespace
 
+    def test_validate_search_term_returns_stripped(self) -> None:
+        """Test search term validation returns the stripped term."""
+        assert validate_search_term('   valid-term   ') == 'valid-term'
+
     def test_validate_search_term_empty(self) -> None:
         """Test search term validation failure with empty string."""
         with pytest.raises(ValueError, match='Search term cannot be empty'):
@@ -52,6 +63,10 @@ class TestValidationHelpers:
         validate_server_name('valid-server-name')
         validate_server_name('   valid-server   ')  # with whitespace
 
+    def test_validate_server_name_returns_stripped(self) -> None:
+        """Test server name validation returns the stripped name."""
+        assert validate_server_name('   valid-server   ') == 'valid-server'
+
     def test_validate_server_name_empty(self) -> None:
         """Test server name validation failure with empty string."""
         with pytest.raises(ValueError, match='Server name cannot be empty'):